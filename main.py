@@ -389,8 +389,7 @@ def build(schedule_file: str, prefs_file: str | None, output: str | None,
     for trial_idx in range(effective_num_trials):
         # Restore snapshot on all trials after the first
         if trial_idx > 0:
-            grid.assignments.clear()
-            grid.assignments.update(_grid_assignments_snap)
+            grid.replace_assignments(_grid_assignments_snap)
             for r in residents:
                 r.schedule.clear()
                 r.schedule.update(_schedules_snap[r.name])
@@ -493,8 +492,7 @@ def build(schedule_file: str, prefs_file: str | None, output: str | None,
 
         for rank, (pre_score, state) in enumerate(top_candidates):
             # Restore state
-            grid.assignments.clear()
-            grid.assignments.update(state[0])
+            grid.replace_assignments(state[0])
             for r in residents:
                 r.schedule.clear()
                 r.schedule.update(state[1].get(r.name, {}))
@@ -531,8 +529,7 @@ def build(schedule_file: str, prefs_file: str | None, output: str | None,
     # ── Restore best trial state (only when effective_num_trials > 1) ───
     if effective_num_trials > 1 and best_trial_state is not None:
         best_assignments, best_schedules, r3_meta_trial, r4_meta_trial, sampler_replacements_trial = best_trial_state
-        grid.assignments.clear()
-        grid.assignments.update(best_assignments)
+        grid.replace_assignments(best_assignments)
         for r in residents:
             r.schedule.clear()
             r.schedule.update(best_schedules[r.name])
@@ -123,6 +123,7 @@ def _write_schedule_sheet(
 
     # Staffing rows
     staff_row = sep_row + 1
+    week_assignments = grid.get_all_week_assignments()
     ws.cell(row=staff_row - 1, column=1, value="STAFFING").font = FONT_BOLD
 
     # Use dynamic constraints if available, otherwise fall back to ROTATION_MINIMUMS
@@ -135,7 +136,7 @@ def _write_schedule_sheet(
         ws.cell(row=staff_row, column=1, value=label).font = FONT_BOLD
         ws.cell(row=staff_row, column=2, value=f"≥{min_req}").alignment = ALIGN_CENTER
         for w in range(1, num_weeks + 1):
-            assignments = grid.get_week_assignments(w)
+            assignments = week_assignments.get(w, {})
             count = sum(1 for c in assignments.values()
                         if c in codes or fse_to_base_code(c) in codes)
             cell = ws.cell(row=staff_row, column=w + week_offset, value=count)
@@ -152,7 +153,7 @@ def _write_schedule_sheet(
         ws.cell(row=staff_row, column=1, value=label).font = FONT_BOLD
         ws.cell(row=staff_row, column=2, value=f"≤{max_allowed}").alignment = ALIGN_CENTER
         for w in range(1, num_weeks + 1):
-            assignments = grid.get_week_assignments(w)
+            assignments = week_assignments.get(w, {})
             count = sum(1 for c in assignments.values()
                         if c in codes or fse_to_base_code(c) in codes)
             cell = ws.cell(row=staff_row, column=w + week_offset, value=count)
@@ -170,7 +171,7 @@ def _write_schedule_sheet(
                                 ("VA", HospitalSystem.VA)]:
         ws.cell(row=staff_row, column=1, value=site_label).font = FONT_BOLD
         for w in range(1, num_weeks + 1):
-            assignments = grid.get_week_assignments(w)
+            assignments = week_assignments.get(w, {})
             count = sum(1 for c in assignments.values() if get_hospital_system(c) == system)
             cell = ws.cell(row=staff_row, column=w + week_offset, value=count)
             cell.alignment = ALIGN_CENTER
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 
 class HospitalSystem(Enum):
@@ -105,6 +106,7 @@ class RotationCode:
         return SITE_PREFIX_MAP.get(first, HospitalSystem.OTHER)
 
 
+@lru_cache(maxsize=None)
 def get_hospital_system(code: str) -> HospitalSystem:
     """Get hospital system for a rotation code string."""
     if not code:
@@ -146,6 +148,18 @@ def fse_to_base_code(fse_code: str) -> str:
     return FSE_STAFFING_MAP.get(suffix, fse_code)
 
 
+@lru_cache(maxsize=None)
+def with_fse_aliases(codes: frozenset[str]) -> frozenset[str]:
+    """Return ``codes`` plus every FSE code whose staffing base code is in it.
+
+    ``c in with_fse_aliases(codes)`` is equivalent to
+    ``c in codes or fse_to_base_code(c) in codes`` as a single lookup.
+    """
+    return codes | {
+        f"FSE-{suffix}" for suffix, base in FSE_STAFFING_MAP.items() if base in codes
+    }
+
+
 def is_night_float(code: str) -> bool:
     """Check if a rotation code is a night float assignment."""
     return code in ("Snf", "Snf2", "Mnf", "Sx")
@@ -81,12 +81,28 @@ class ScheduleGrid:
 
     Stores rotation assignments as a dict of (resident_name, week_number) → rotation_code.
     Week numbers are 1-based (week 1 = first week of Block 1).
+
+    Base assignments are mirrored in a per-week index so week lookups don't
+    scan the whole grid; write them through assign / assign_block /
+    replace_assignments rather than mutating ``assignments`` directly.
     """
     blocks: list[Block] = field(default_factory=list)
     # (resident_name, week_number) → rotation_code
     assignments: dict[tuple[str, int], str] = field(default_factory=dict)
     # Night float overlay: (resident_name, week_number) → NF code
     nf_assignments: dict[tuple[str, int], str] = field(default_factory=dict)
+    # week_number → {resident_name: rotation_code}, mirrors assignments
+    _week_index: dict[int, dict[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._rebuild_week_index()
+
+    def _rebuild_week_index(self) -> None:
+        self._week_index = {}
+        for (name, w), code in self.assignments.items():
+            self._week_index.setdefault(w, {})[name] = code
 
     @property
     def total_weeks(self) -> int:
@@ -96,6 +112,20 @@ class ScheduleGrid:
 
     def assign(self, resident_name: str, week: int, code: str) -> None:
         self.assignments[(resident_name, week)] = code
+        self._week_index.setdefault(week, {})[resident_name] = code
+
+    def assign_block(self, resident_name: str, block: int, code: str) -> None:
+        """Assign a rotation code to all 4 weeks of a block in one update."""
+        weeks = self.block_to_weeks(block)
+        self.assignments.update({(resident_name, w): code for w in weeks})
+        for w in weeks:
+            self._week_index.setdefault(w, {})[resident_name] = code
+
+    def replace_assignments(self, assignments: dict[tuple[str, int], str]) -> None:
+        """Replace all base assignments (e.g. restoring a saved snapshot)."""
+        self.assignments.clear()
+        self.assignments.update(assignments)
+        self._rebuild_week_index()
 
     def assign_nf(self, resident_name: str, week: int, code: str) -> None:
         self.nf_assignments[(resident_name, week)] = code
@@ -113,16 +143,25 @@ class ScheduleGrid:
 
     def get_week_assignments(self, week: int) -> dict[str, str]:
         """Get all resident assignments for a given week."""
-        result = {}
-        for (name, w), code in self.assignments.items():
-            if w == week:
-                result[name] = code
+        result = dict(self._week_index.get(week, {}))
         # Apply NF overlay
         for (name, w), code in self.nf_assignments.items():
             if w == week:
                 result[name] = code
         return result
 
+    def get_all_week_assignments(self) -> dict[int, dict[str, str]]:
+        """Get {week: {resident_name: code}} for every week in one pass.
+
+        Same result as get_week_assignments() per week, but walks the NF
+        overlay once instead of once per week.
+        """
+        result = {w: dict(codes) for w, codes in self._week_index.items()}
+        # Apply NF overlay
+        for (name, w), code in self.nf_assignments.items():
+            result.setdefault(w, {})[name] = code
+        return result
+
     def get_resident_schedule(self, resident_name: str) -> dict[int, str]:
         """Get full schedule for one resident."""
         result = {}
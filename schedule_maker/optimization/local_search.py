@@ -232,11 +232,11 @@ def apply_swap(
         for w in grid.block_to_weeks(swap.block1):
             if res1.schedule.get(w) == swap.code1:
                 res1.schedule[w] = swap.code2
-                grid.assignments[(res1.name, w)] = swap.code2
+                grid.assign(res1.name, w, swap.code2)
         for w in grid.block_to_weeks(swap.block2):
             if res1.schedule.get(w) == swap.code2:
                 res1.schedule[w] = swap.code1
-                grid.assignments[(res1.name, w)] = swap.code1
+                grid.assign(res1.name, w, swap.code1)
     else:
         # Between-resident swap
         res2 = name_map[swap.resident2]
@@ -245,11 +245,11 @@ def apply_swap(
         for w in grid.block_to_weeks(swap.block1):
             if res1.schedule.get(w) == swap.code1:
                 res1.schedule[w] = swap.code2
-                grid.assignments[(res1.name, w)] = swap.code2
+                grid.assign(res1.name, w, swap.code2)
         for w in grid.block_to_weeks(b2):
             if res2.schedule.get(w) == swap.code2:
                 res2.schedule[w] = swap.code1
-                grid.assignments[(res2.name, w)] = swap.code1
+                grid.assign(res2.name, w, swap.code1)
 
 
 def revert_swap(
@@ -376,8 +376,7 @@ def local_search_refine(
     for r in residents:
         r.schedule.clear()
         r.schedule.update(best_state.get(r.name, {}))
-    grid.assignments.clear()
-    grid.assignments.update(best_grid_state)
+    grid.replace_assignments(best_grid_state)
 
     stats = {
         "iterations": i + 1,
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import random as _random
+from collections import Counter
 
 from schedule_maker.models.resident import Resident
 from schedule_maker.models.schedule import ScheduleGrid
-from schedule_maker.models.rotation import get_hospital_system, get_same_section_codes, HospitalSystem
+from schedule_maker.models.rotation import get_same_section_codes
 from schedule_maker.models.constraints import StaffingConstraint
 from schedule_maker.staffing_utils import (
     rank_rotations_by_need, rank_rotations_by_combined_score,
     block_exceeds_max, build_fill_candidates,
-    compute_run_penalty, block_has_nf,
+    compute_run_penalty, block_has_nf, has_hospital_conflict,
     _ROTATION_YEAR_ELIGIBILITY,
 )
 
@@ -25,22 +26,6 @@ AIRP_RANK_WEIGHT = 10
 AIRP_GROUPMATE_BONUS = 8
 
 
-def _has_hospital_conflict(schedule: dict[int, str], block: int, code: str) -> bool:
-    """Check if assigning `code` to `block` creates a hospital system conflict."""
-    target_system = get_hospital_system(code)
-    if target_system == HospitalSystem.OTHER:
-        return False
-
-    start_week = (block - 1) * 4 + 1
-    for w in range(start_week, start_week + 4):
-        existing = schedule.get(w, "")
-        if existing:
-            existing_system = get_hospital_system(existing)
-            if existing_system != HospitalSystem.OTHER and existing_system != target_system:
-                return True
-    return False
-
-
 def _build_airp_sessions(residents: list[Resident]) -> dict[str, list[int]]:
     """Build AIRP sessions from resident preferences.
 
@@ -204,9 +189,8 @@ def assign_learning_center(
     else:
         lc_block = core_exam_block - 1
         for res in r3s:
-            for w in grid.block_to_weeks(lc_block):
-                grid.assign(res.name, w, "LC")
-                res.schedule[w] = "LC"
+            grid.assign_block(res.name, lc_block, "LC")
+            res.schedule.update(dict.fromkeys(grid.block_to_weeks(lc_block), "LC"))
 
 
 def assign_core(
@@ -284,11 +268,7 @@ def fill_r3_clinical(
 
     metadata = {}
     for res in r3s:
-        req_filled = _fill_r3_requirements(
-            res, grid, staffing_constraints, rng=rng,
-            shuffle_blocks=shuffle_blocks, top_k_sample=top_k_sample,
-        )
-        remaining_filled = _fill_r3_remaining(
+        req_filled, remaining_filled = _fill_r3(
             res, grid, staffing_constraints, rng=rng,
             shuffle_blocks=shuffle_blocks, top_k_sample=top_k_sample,
         )
@@ -328,9 +308,51 @@ def build_r3_schedules(
     return metadata
 
 
+def _fill_r3(
+    res: Resident,
+    grid: ScheduleGrid,
+    staffing_constraints: list[StaffingConstraint] | None = None,
+    rng: _random.Random | None = None,
+    shuffle_blocks: bool = False,
+    top_k_sample: int = 1,
+) -> tuple[dict[int, str], dict[int, str]]:
+    """Fill an R3's open blocks: graduation requirements, then general clinical.
+
+    Available blocks and the LC block are computed once and shared by both
+    passes; blocks filled by the requirements pass are dropped from the
+    running ``available`` set before the remaining pass runs.
+
+    Returns (requirement_filled, remaining_filled) block → code maps.
+    """
+    # Get available blocks (not yet assigned)
+    available: set[int] = set()
+    for block in range(1, 14):
+        if not all(res.schedule.get(w) for w in grid.block_to_weeks(block)):
+            available.add(block)
+
+    # Determine LC block (Zir must be placed before the block preceding LC)
+    lc_block = None
+    for block in range(1, 14):
+        if any(res.schedule.get(w) == "LC" for w in grid.block_to_weeks(block)):
+            lc_block = block
+            break
+
+    req_filled = _fill_r3_requirements(
+        res, grid, available, lc_block, staffing_constraints, rng=rng,
+        shuffle_blocks=shuffle_blocks, top_k_sample=top_k_sample,
+    )
+    remaining_filled = _fill_r3_remaining(
+        res, grid, available, lc_block, staffing_constraints, rng=rng,
+        shuffle_blocks=shuffle_blocks, top_k_sample=top_k_sample,
+    )
+    return req_filled, remaining_filled
+
+
 def _fill_r3_requirements(
     res: Resident,
     grid: ScheduleGrid,
+    available: set[int],
+    lc_block: int | None,
     staffing_constraints: list[StaffingConstraint] | None = None,
     rng: _random.Random | None = None,
     shuffle_blocks: bool = False,
@@ -350,26 +372,14 @@ def _fill_r3_requirements(
     - Staffing need (prefers blocks with the largest deficit for a rotation)
 
     Args:
+        available: Open blocks; filled blocks are discarded in place.
+        lc_block: Block holding LC, or None.
         shuffle_blocks: Randomize block order within schedule weight groups.
         top_k_sample: Sample from top K rotations instead of best.
     """
     from schedule_maker.staffing_utils import weighted_sample_top_k
     filled = {}
-
-    # Get available blocks (not yet assigned)
-    available_blocks = []
-    for block in range(1, 14):
-        weeks = list(grid.block_to_weeks(block))
-        if not all(res.schedule.get(w) for w in weeks):
-            available_blocks.append(block)
-
-    # Determine LC block
-    lc_block = None
-    for block in range(1, 14):
-        weeks = list(grid.block_to_weeks(block))
-        if any(res.schedule.get(w) == "LC" for w in weeks):
-            lc_block = block
-            break
+    available_blocks = sorted(available)
 
     # Build remaining_counts from recommended_blocks
     remaining_counts: dict[str, int] = {}
@@ -384,10 +394,8 @@ def _fill_r3_requirements(
 
     # Breast deficit — Pcbi gets large priority bonus
     breast_codes = {"Pcbi", "Sbi"}
-    breast_total = sum(res.history.get(c, 0) for c in breast_codes)
-    for w, code in res.schedule.items():
-        if code in breast_codes:
-            breast_total += 1
+    scheduled = Counter(res.schedule.values())
+    breast_total = sum(res.history.get(c, 0) + scheduled[c] for c in breast_codes)
     breast_deficit_weeks = max(0, 12 - breast_total)
     breast_blocks_needed = -(-breast_deficit_weeks // 4)  # ceil division
     if breast_blocks_needed > 0:
@@ -457,7 +465,7 @@ def _fill_r3_requirements(
                 if lc_block and block >= lc_block - 1:
                     continue
 
-            if _has_hospital_conflict(res.schedule, block, rotation):
+            if has_hospital_conflict(res.schedule, block, rotation):
                 continue
 
             # NRDR Mnuc: graduation requirement takes precedence over max cap
@@ -518,6 +526,7 @@ def _fill_r3_requirements(
             best_code = scored_rotations[0][0]
 
         _assign_block(res, grid, block, best_code)
+        available.discard(block)
         filled[block] = best_code
         remaining_counts[best_code] -= 1
         if best_code == "Zir":
@@ -529,6 +538,8 @@ def _fill_r3_requirements(
 def _fill_r3_remaining(
     res: Resident,
     grid: ScheduleGrid,
+    available: set[int],
+    lc_block: int | None,
     staffing_constraints: list[StaffingConstraint] | None = None,
     rng: _random.Random | None = None,
     shuffle_blocks: bool = False,
@@ -537,22 +548,21 @@ def _fill_r3_remaining(
     """Fill remaining empty R3 blocks with general clinical rotations.
 
     After graduation requirements are placed, any empty blocks are filled
-    with rotations that help cover staffing needs: Peds (if short), then
-    a round-robin of common clinical services.
+    with rotations that help cover staffing needs.  Every fill candidate is
+    ranked by staffing need + preference and the best one that passes the
+    hospital-conflict / cap / Zir / NF checks is used, so a conflict on the
+    top choice falls through to the next rather than leaving a hole.
 
     Args:
+        available: Open blocks; filled blocks are discarded in place.
+        lc_block: Block holding LC, or None.
         shuffle_blocks: Randomize block order within schedule weight groups.
         top_k_sample: Sample from top K rotations instead of best.
     """
     from schedule_maker.staffing_utils import weighted_sample_top_k
     filled = {}
 
-    available_blocks = []
-    for block in range(1, 14):
-        weeks = list(grid.block_to_weeks(block))
-        if not all(res.schedule.get(w) for w in weeks):
-            available_blocks.append(block)
-
+    available_blocks = sorted(available)
     if not available_blocks:
         return filled
 
@@ -560,10 +570,12 @@ def _fill_r3_remaining(
     fill_rotations = build_fill_candidates(staffing_constraints, r_year=3)
     # Expand with any preferred rotations not already in the list
     if res.section_prefs and res.section_prefs.top:
+        fill_set = set(fill_rotations)
         for code in res.section_prefs.top:
-            if code not in fill_rotations and \
+            if code not in fill_set and \
                (code not in _ROTATION_YEAR_ELIGIBILITY or 3 in _ROTATION_YEAR_ELIGIBILITY[code]):
                 fill_rotations.append(code)
+                fill_set.add(code)
     # Sort available blocks by schedule weight preference
     # When shuffle_blocks is enabled, shuffle within schedule weight groups
     if shuffle_blocks and rng:
@@ -584,15 +596,9 @@ def _fill_r3_remaining(
     elif res.schedule_weight == "back-heavy":
         available_blocks.sort(reverse=True)
 
-    # Determine LC block for Zir eligibility check
-    _lc_block = None
-    for _b in range(1, 14):
-        if any(res.schedule.get(w) == "LC" for w in grid.block_to_weeks(_b)):
-            _lc_block = _b
-            break
-
-    for block in list(available_blocks):
-        has_zir = any(v == "Zir" for v in res.schedule.values())
+    scheduled = Counter(res.schedule.values())
+    for block in available_blocks:
+        has_zir = scheduled["Zir"] > 0
         ranked = rank_rotations_by_combined_score(
             grid, block, fill_rotations, res.section_prefs,
             constraints=staffing_constraints, r_year=3,
@@ -609,9 +615,9 @@ def _fill_r3_remaining(
                 )
 
         # Force Zir to top when it has 0 staffing and resident is eligible
-        if not has_zir and (_lc_block is None or block < _lc_block - 1) \
+        if not has_zir and (lc_block is None or block < lc_block - 1) \
                 and _block_fully_available(res, grid, block) \
-                and not _has_hospital_conflict(res.schedule, block, "Zir") \
+                and not has_hospital_conflict(res.schedule, block, "Zir") \
                 and not block_exceeds_max(grid, block, "Zir") \
                 and not block_has_nf(res.schedule, block, grid, resident_name=res.name):
             zir_unstaffed = all(
@@ -625,9 +631,8 @@ def _fill_r3_remaining(
         # Force Mnuc to top for NRDR R3s who still need more Mnuc blocks
         nrdr_mnuc_deficit = False
         if res.is_nrdr:
-            mnuc_placed = sum(1 for v in res.schedule.values() if v == "Mnuc")
-            nrdr_mnuc_deficit = mnuc_placed < 24
-            if nrdr_mnuc_deficit and not _has_hospital_conflict(res.schedule, block, "Mnuc"):
+            nrdr_mnuc_deficit = scheduled["Mnuc"] < 24
+            if nrdr_mnuc_deficit and not has_hospital_conflict(res.schedule, block, "Mnuc"):
                 ranked = [(c, s) for c, s in ranked if c != "Mnuc"]
                 ranked.insert(0, ("Mnuc", float("inf")))
 
@@ -637,12 +642,12 @@ def _fill_r3_remaining(
                 return False
             if c == "Zir" and not _block_fully_available(res, grid, block):
                 return False
-            if c == "Zir" and _lc_block is not None and block >= _lc_block - 1:
+            if c == "Zir" and lc_block is not None and block >= lc_block - 1:
                 return False
             if c in _IR_CODES and block_has_nf(res.schedule, block, grid, resident_name=res.name):
                 return False
             nrdr_override = nrdr_mnuc_deficit and c == "Mnuc"
-            if _has_hospital_conflict(res.schedule, block, c):
+            if has_hospital_conflict(res.schedule, block, c):
                 return False
             if not nrdr_override and block_exceeds_max(grid, block, c):
                 return False
@@ -675,8 +680,9 @@ def _fill_r3_remaining(
                     if alt_pen < run_pen:
                         code = alt_code
 
+        scheduled[code] += sum(1 for w in grid.block_to_weeks(block) if not res.schedule.get(w))
         _assign_block(res, grid, block, code)
-        available_blocks.remove(block)
+        available.discard(block)
         filled[block] = code
 
     return filled
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import random as _random
+from collections import Counter
+from functools import lru_cache
 
 from schedule_maker.models.resident import Resident, Pathway, SectionPrefs
 from schedule_maker.models.schedule import ScheduleGrid
-from schedule_maker.models.rotation import get_hospital_system, get_same_section_codes, HospitalSystem, SECTION_TO_ROTATION_CODES
+from schedule_maker.models.rotation import get_same_section_codes, SECTION_TO_ROTATION_CODES
 from schedule_maker.models.constraints import StaffingConstraint
 from schedule_maker.staffing_utils import (
     rank_rotations_by_need, rank_rotations_by_combined_score,
     block_exceeds_max, build_fill_candidates, block_has_nf,
-    compute_run_penalty,
+    compute_run_penalty, has_hospital_conflict,
     _ROTATION_YEAR_ELIGIBILITY,
 )
 
@@ -218,10 +220,8 @@ def _build_t32_schedule(
 
     # Runtime breast deficit — prioritize breast in clinical blocks
     breast_codes = {"Pcbi", "Sbi"}
-    breast_total = sum(res.history.get(c, 0) for c in breast_codes)
-    for w, code in res.schedule.items():
-        if code in breast_codes:
-            breast_total += 1
+    scheduled = Counter(res.schedule.values())
+    breast_total = sum(res.history.get(c, 0) + scheduled[c] for c in breast_codes)
     breast_deficit_weeks = max(0, 12 - breast_total)
     breast_blocks_needed = -(-breast_deficit_weeks // 4)
 
@@ -230,7 +230,7 @@ def _build_t32_schedule(
         if placed_breast >= breast_blocks_needed:
             break
         for try_code in ("Pcbi", "Sbi"):
-            if not _has_hospital_conflict(res.schedule, block, try_code) and \
+            if not has_hospital_conflict(res.schedule, block, try_code) and \
                not block_exceeds_max(grid, block, try_code):
                 _assign_block(res, grid, block, try_code)
                 available.remove(block)
@@ -250,7 +250,7 @@ def _build_t32_schedule(
         for block in list(available):
             if placed >= blocks_needed:
                 break
-            if not _has_hospital_conflict(res.schedule, block, rotation) and \
+            if not has_hospital_conflict(res.schedule, block, rotation) and \
                not block_exceeds_max(grid, block, rotation):
                 _assign_block(res, grid, block, rotation)
                 available.remove(block)
@@ -264,7 +264,7 @@ def _build_t32_schedule(
         for code, _deficit in ranked:
             if code == "Zir":
                 continue
-            if not _has_hospital_conflict(res.schedule, block, code) and \
+            if not has_hospital_conflict(res.schedule, block, code) and \
                not block_exceeds_max(grid, block, code):
                 _assign_block(res, grid, block, code)
                 available.remove(block)
@@ -291,6 +291,7 @@ _FSE_NAME_ALIASES: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=None)
 def _fse_to_rotation_code(fse_name: str) -> str:
     """Map an FSE specialty name to its actual rotation code.
 
@@ -357,7 +358,8 @@ def _place_fixed_commitments(res: Resident, grid: ScheduleGrid, meta: dict, lc_b
             )
             for block in candidates:
                 # NRDR Mnuc: graduation requirement takes precedence over max cap
-                if not block_exceeds_max(grid, block, "Mnuc") or placed < mnuc_needed:
+                # (checked first so the grid scan is skipped while still short)
+                if placed < mnuc_needed or not block_exceeds_max(grid, block, "Mnuc"):
                     _assign_block(res, grid, block, "Mnuc")
                     available_blocks.remove(block)
                     nrdr_placed.append(block)
@@ -395,7 +397,8 @@ def _place_fixed_commitments(res: Resident, grid: ScheduleGrid, meta: dict, lc_b
         neuro_needed = 6
         placed_mucic = 0
         placed_smr = 0
-        for block in list(available_blocks):
+        taken: set[int] = set()
+        for block in available_blocks:
             if placed_mucic + placed_smr >= neuro_needed:
                 break
             if placed_smr < 1:
@@ -408,7 +411,8 @@ def _place_fixed_commitments(res: Resident, grid: ScheduleGrid, meta: dict, lc_b
                     placed_smr += 1
                 else:
                     placed_mucic += 1
-                available_blocks.remove(block)
+                taken.add(block)
+        available_blocks = [b for b in available_blocks if b not in taken]
         meta["esnr_neuro_blocks"] = placed_mucic + placed_smr
 
     # FSE blocks — use actual rotation codes, not FSE-Xxx prefixes
@@ -439,7 +443,7 @@ def _place_fixed_commitments(res: Resident, grid: ScheduleGrid, meta: dict, lc_b
                     key=lambda b: -_org_pref_score(b, fse_placed_blocks, fse_org),
                 )
                 for block in candidates:
-                    conflict = not exempt and _has_hospital_conflict(res.schedule, block, fse_code)
+                    conflict = not exempt and has_hospital_conflict(res.schedule, block, fse_code)
                     if not conflict and not block_exceeds_max(grid, block, fse_code):
                         _assign_block(res, grid, block, fse_code)
                         available_blocks.remove(block)
@@ -493,10 +497,8 @@ def _fill_grad_requirements(
 
     # Breast deficit check — Pcbi gets a large priority bonus
     breast_codes = {"Pcbi", "Sbi"}
-    breast_total = sum(res.history.get(c, 0) for c in breast_codes)
-    for w, code in res.schedule.items():
-        if code in breast_codes:
-            breast_total += 1
+    scheduled = Counter(res.schedule.values())
+    breast_total = sum(res.history.get(c, 0) + scheduled[c] for c in breast_codes)
     breast_deficit_weeks = max(0, 12 - breast_total)
     breast_blocks_needed = -(-breast_deficit_weeks // 4)  # ceil division
 
@@ -546,6 +548,9 @@ def _fill_grad_requirements(
     else:
         sorted_blocks = sorted(available)
 
+    # Per-resident invariants — evaluated once, not per (block, rotation)
+    apply_run_pen = _r4_run_penalty_eligible(res)
+
     # Block-first iteration: for each block pick best rotation from remaining pool
     for block in sorted_blocks:
         if block not in available:
@@ -562,7 +567,7 @@ def _fill_grad_requirements(
                 continue
             if rotation in _IR_CODES and block_has_nf(res.schedule, block, grid, resident_name=res.name):
                 continue
-            if _has_hospital_conflict(res.schedule, block, rotation):
+            if has_hospital_conflict(res.schedule, block, rotation):
                 continue
             if block_exceeds_max(grid, block, rotation) and not (res.is_nrdr and rotation == "Mnuc"):
                 continue
@@ -589,7 +594,7 @@ def _fill_grad_requirements(
 
             # Run penalty for regular R4s (not pathway residents)
             # Applies to all rotation codes including FSE codes
-            if _r4_run_penalty_eligible(res):
+            if apply_run_pen:
                 run_pen = compute_run_penalty(res.schedule, block, rotation, grid)
                 score -= _R4_RUN_PENALTY_WEIGHT * run_pen
 
@@ -678,12 +683,14 @@ def _fill_remaining(
 
     # Fill remaining with staffing-need + preference rotations
     fill_rotations = build_fill_candidates(staffing_constraints, r_year=4)
+    fill_set = set(fill_rotations)
     # Expand with any preferred rotations not already in the list
     if res.section_prefs and res.section_prefs.top:
         for code in res.section_prefs.top:
-            if code not in fill_rotations and \
+            if code not in fill_set and \
                (code not in _ROTATION_YEAR_ELIGIBILITY or 4 in _ROTATION_YEAR_ELIGIBILITY[code]):
                 fill_rotations.append(code)
+                fill_set.add(code)
 
     # Boost FSE rotation codes with higher weight than general section prefs
     fse_pref_weight = 3  # default
@@ -694,13 +701,16 @@ def _fill_remaining(
         # Build boosted prefs: copy existing scores and add FSE codes at max score
         base_scores = dict(effective_prefs.scores) if effective_prefs and effective_prefs.scores else {}
         base_top = list(effective_prefs.top) if effective_prefs else []
+        top_set = set(base_top)
         for fc in fse_codes:
             base_scores[fc] = max(base_scores.get(fc, 0), 3)  # max positive score
-            if fc not in base_top:
+            if fc not in top_set:
                 base_top.append(fc)
-            if fc not in fill_rotations and \
+                top_set.add(fc)
+            if fc not in fill_set and \
                (fc not in _ROTATION_YEAR_ELIGIBILITY or 4 in _ROTATION_YEAR_ELIGIBILITY[fc]):
                 fill_rotations.append(fc)
+                fill_set.add(fc)
         effective_prefs = SectionPrefs(
             top=base_top,
             bottom=list(effective_prefs.bottom) if effective_prefs else [],
@@ -709,6 +719,8 @@ def _fill_remaining(
 
     exempt = res.name in HOSPITAL_CONFLICT_EXEMPT
     fse_code_set = set(fse_codes) if res.fse_prefs and res.fse_prefs.specialties else set()
+    zir_eligible = _r4_zir_eligible(res)
+    apply_run_pen = _r4_run_penalty_eligible(res)
 
     for block in list(available):
         ranked = rank_rotations_by_combined_score(
@@ -728,10 +740,10 @@ def _fill_remaining(
                 )
 
         # Force Zir to top for eligible R4 when Zir is understaffed in LC window
-        if _r4_zir_eligible(res) and block >= lc_block - 1 \
+        if zir_eligible and block >= lc_block - 1 \
                 and not block_exceeds_max(grid, block, "Zir") \
                 and not block_has_nf(res.schedule, block, grid, resident_name=res.name) \
-                and not _has_hospital_conflict(res.schedule, block, "Zir"):
+                and not has_hospital_conflict(res.schedule, block, "Zir"):
             zir_unstaffed = all(
                 grid.get_section_staffing(w, {"Zir"}) < 1
                 for w in grid.block_to_weeks(block)
@@ -742,12 +754,12 @@ def _fill_remaining(
 
         # Helper to check if a rotation is valid for this block
         def _is_valid_rotation(c: str) -> bool:
-            if c == "Zir" and (not _r4_zir_eligible(res) or block < lc_block - 1):
+            if c == "Zir" and (not zir_eligible or block < lc_block - 1):
                 return False
             if c in _IR_CODES and block_has_nf(res.schedule, block, grid, resident_name=res.name):
                 return False
             skip_conflict = exempt and c in fse_code_set
-            if not (skip_conflict or not _has_hospital_conflict(res.schedule, block, c)):
+            if not (skip_conflict or not has_hospital_conflict(res.schedule, block, c)):
                 return False
             if block_exceeds_max(grid, block, c):
                 return False
@@ -758,8 +770,6 @@ def _fill_remaining(
         if not valid_ranked:
             continue
 
-        apply_run_pen = _r4_run_penalty_eligible(res)
-
         # Use top-K sampling when enabled, otherwise pick best with run penalty logic
         if rng is not None and top_k_sample > 1 and len(valid_ranked) > 1:
             code, _ = weighted_sample_top_k(valid_ranked, top_k_sample, rng)
@@ -799,21 +809,5 @@ def _fill_remaining(
 
 def _assign_block(res: Resident, grid: ScheduleGrid, block: int, code: str) -> None:
     """Assign a rotation code to all weeks of a block."""
-    for w in grid.block_to_weeks(block):
-        grid.assign(res.name, w, code)
-        res.schedule[w] = code
-
-
-def _has_hospital_conflict(schedule: dict[int, str], block: int, code: str) -> bool:
-    """Check hospital system conflict within a block."""
-    target = get_hospital_system(code)
-    if target == HospitalSystem.OTHER:
-        return False
-    start = (block - 1) * 4 + 1
-    for w in range(start, start + 4):
-        existing = schedule.get(w, "")
-        if existing:
-            sys = get_hospital_system(existing)
-            if sys != HospitalSystem.OTHER and sys != target:
-                return True
-    return False
+    grid.assign_block(res.name, block, code)
+    res.schedule.update(dict.fromkeys(grid.block_to_weeks(block), code))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from schedule_maker.models.resident import Resident
 from schedule_maker.models.schedule import ScheduleGrid
 from schedule_maker.models.constraints import StaffingConstraint
@@ -10,6 +12,16 @@ from schedule_maker.staffing_utils import rank_rotations_by_need
 SAMPLER_POOL = ["Pcbi", "Mnuc", "Mucic", "Mb"]
 
 
+@lru_cache(maxsize=None)
+def _is_sampler_code(code: str) -> bool:
+    """True for Msamp/Msampler-style placeholder codes (case-insensitive).
+
+    Codes come from the workbook so the vocabulary is open-ended, but it is
+    small — cache the lowercase substring test per distinct code.
+    """
+    return "samp" in code.lower()
+
+
 def resolve_samplers(
     residents: list[Resident],
     grid: ScheduleGrid,
@@ -36,7 +48,7 @@ def resolve_samplers(
         # Find all Msamp/Msampler weeks
         sampler_weeks = sorted(
             w for w, code in res.schedule.items()
-            if code and ("samp" in code.lower() or "sampler" in code.lower())
+            if code and _is_sampler_code(code)
         )
 
         if not sampler_weeks:
@@ -54,6 +66,13 @@ def resolve_samplers(
                 current_block = [w]
         blocks.append(current_block)
 
+        # Preference bonus depends only on the resident's rankings — compute
+        # once here rather than per sampler block (lower rank = better)
+        pref_bonus: dict[str, int] = {}
+        if res.sampler_prefs and res.sampler_prefs.rankings:
+            rankings = res.sampler_prefs.rankings
+            pref_bonus = {rot: max(0, 5 - rankings.get(rot, 99)) for rot in SAMPLER_POOL}
+
         used_rotations: set[str] = set()
 
         for block_weeks in blocks:
@@ -69,12 +88,7 @@ def resolve_samplers(
             # Build combined score: staffing need + preference - dedup penalty
             scored: list[tuple[str, float]] = []
             for rot in SAMPLER_POOL:
-                score = 2.0 * staffing_scores.get(rot, 0.0)
-
-                # Preference bonus (lower rank = better, so invert)
-                if res.sampler_prefs and res.sampler_prefs.rankings:
-                    rank = res.sampler_prefs.rankings.get(rot, 99)
-                    score += max(0, 5 - rank)
+                score = 2.0 * staffing_scores.get(rot, 0.0) + pref_bonus.get(rot, 0)
 
                 # Dedup penalty (large enough to override staffing/pref scores)
                 if rot in used_rotations:
@@ -0,0 +1,8 @@
+"""Shared settings for the CP-SAT solvers."""
+
+from __future__ import annotations
+
+import os
+
+# One search worker per core; explicit num_workers overrides this
+DEFAULT_NUM_WORKERS = os.cpu_count() or 8
@@ -8,9 +8,95 @@ from ortools.sat.python import cp_model
 
 from schedule_maker.models.resident import Resident
 from schedule_maker.models.constraints import NFRules, StaffingConstraint
+from schedule_maker.solver.config import DEFAULT_NUM_WORKERS
 from schedule_maker.validation.staffing import ROTATION_MINIMUMS
 
 
+def _week_lits(name: str, week: int, *var_maps: dict) -> list:
+    """Literals that exist for (name, week) across *var_maps*."""
+    return [m[name, week] for m in var_maps if (name, week) in m]
+
+
+def _week_lits_all(residents: list[Resident], week: int, var_map: dict) -> list:
+    """Literals that exist in *var_map* for *week* across *residents*."""
+    return [var_map[r.name, week] for r in residents if (r.name, week) in var_map]
+
+
+def _resident_lits(var_map: dict, name: str, num_weeks: int) -> list:
+    """Literals that exist in *var_map* for *name* across all weeks."""
+    return [var_map[name, w] for w in range(1, num_weeks + 1) if (name, w) in var_map]
+
+
+def _greedy_hint(
+    residents: list[Resident],
+    base_schedule: dict[str, dict[int, str]],
+    rules: NFRules,
+    num_weeks: int,
+    var_maps: dict[str, dict],
+    locked_assignments: dict[str, list[tuple[int, str]]],
+) -> set[tuple[str, int, str]]:
+    """Greedy NF placement used as a CP-SAT solution hint.
+
+    Walks the weeks in order and gives each open shift to the eligible
+    resident with the most required NF weeks still unplaced (preferring
+    pulls from preferred rotations), respecting min spacing.  Only the
+    hard per-resident minimums are targeted; it need not be feasible.
+    """
+    total_need: dict[str, int] = {}
+    shift_need: dict[tuple[str, str], int] = {}
+    for res in residents:
+        if res.r_year == 2:
+            need = {"Mnf": rules.r2_mnf_weeks, "Snf2": 0}
+            total_need[res.name] = rules.r2_mnf_weeks
+        elif res.r_year == 3:
+            need = {"Mnf": min(1, rules.r3_mnf_max), "Snf2": min(1, rules.r3_snf2_max)}
+            total_need[res.name] = 1
+        else:
+            need = {"Mnf": rules.r4_mnf_weeks, "Snf2": rules.r4_snf2_weeks}
+            total_need[res.name] = rules.r4_mnf_weeks + rules.r4_snf2_weeks
+        for shift, n in need.items():
+            shift_need[res.name, shift] = n
+
+    placed: set[tuple[str, int, str]] = set()
+    taken: set[tuple[int, str]] = set()
+    nf_weeks: dict[str, list[int]] = {}
+
+    def _place(name: str, week: int, shift: str) -> None:
+        placed.add((name, week, shift))
+        taken.add((week, shift))
+        nf_weeks.setdefault(name, []).append(week)
+        total_need[name] = total_need.get(name, 0) - 1
+        shift_need[name, shift] = shift_need.get((name, shift), 0) - 1
+
+    for name, locked in locked_assignments.items():
+        for week, shift in locked:
+            if (name, week) in var_maps.get(shift, {}):
+                _place(name, week, shift)
+
+    for w in range(1, num_weeks + 1):
+        for shift, var_map in var_maps.items():
+            if (w, shift) in taken:
+                continue
+            best = None
+            best_key = None
+            for res in residents:
+                name = res.name
+                if (name, w) not in var_map:
+                    continue
+                if total_need[name] <= 0 or shift_need[name, shift] <= 0:
+                    continue
+                if any(abs(w - prev) < rules.min_spacing_weeks for prev in nf_weeks.get(name, ())):
+                    continue
+                base_rot = base_schedule.get(name, {}).get(w, "")
+                key = (total_need[name], base_rot in rules.preferred_pull_rotations)
+                if best_key is None or key > best_key:
+                    best, best_key = name, key
+            if best is not None:
+                _place(best, w, shift)
+
+    return placed
+
+
 @dataclass
 class NFAssignmentResult:
     """Result of night float assignment optimization."""
@@ -35,6 +121,8 @@ def solve_night_float(
     holiday_weeks: dict[str, list[int]] | None = None,
     holiday_penalty_weight: int = 5,
     nocall_buffer_weight: int = 3,
+    num_workers: int | None = None,
+    log_search_progress: bool = False,
 ) -> NFAssignmentResult:
     """Solve NF assignment using CP-SAT.
 
@@ -49,6 +137,8 @@ def solve_night_float(
         staffing_snapshot: {week: {rotation_label: current_count}} for staffing awareness
         staffing_penalty_weight: penalty for pulling from at/below-minimum rotations
         no_call_penalty_weight: penalty for assigning NF on a no-call week
+        num_workers: CP-SAT search workers (default DEFAULT_NUM_WORKERS; 0 = all cores)
+        log_search_progress: print CP-SAT search log to stdout
 
     Returns:
         NFAssignmentResult
@@ -65,19 +155,69 @@ def solve_night_float(
     r3s = [r for r in residents if r.r_year == 3]
     r4s = [r for r in residents if r.r_year == 4]
 
-    # Decision variables: nf[resident_name, week] ∈ {0=none, 1=Mnf, 2=Snf2}
-    # (Snf and Sx are already in R2 tracks, not assigned here)
-    nf_vars: dict[tuple[str, int], cp_model.IntVar] = {}
+    eligible_residents = r2s + r3s + r4s
+
+    # Build reverse map: rotation_code → rotation_label for staffing lookup
+    _code_to_labels: dict[str, list[str]] = {}
+    _label_to_min: dict[str, int] = {}
+    _label_to_codes: dict[str, set[str]] = {}
+    if staffing_snapshot:
+        if staffing_constraints:
+            for sc in staffing_constraints:
+                for c in sc.rotation_codes:
+                    _code_to_labels.setdefault(c, []).append(sc.label)
+                _label_to_min[sc.label] = sc.min_count
+                _label_to_codes[sc.label] = sc.rotation_codes
+        else:
+            for label, (codes, _min_req) in ROTATION_MINIMUMS.items():
+                for c in codes:
+                    _code_to_labels.setdefault(c, []).append(label)
+                _label_to_min[label] = _min_req
+                _label_to_codes[label] = codes
+
+    # Base rotations that cannot lose anyone to NF in a given week: the
+    # staffing group is already at or below its minimum.
+    frozen_codes: dict[int, set[str]] = {}
+    if staffing_snapshot:
+        for w in range(1, num_weeks + 1):
+            week_staffing = staffing_snapshot.get(w, {})
+            for label, min_req in _label_to_min.items():
+                if min_req > 0 and week_staffing.get(label, 0) <= min_req:
+                    frozen_codes.setdefault(w, set()).update(
+                        _label_to_codes.get(label, set())
+                    )
+
+    # Decision variables: mnf/snf2[resident_name, week] ∈ {0, 1}
+    # (Snf and Sx are already in R2 tracks, not assigned here).
+    # Literals that the hard rules below would pin to 0 are never created;
+    # a missing key means that shift is impossible for that resident-week.
     mnf_vars: dict[tuple[str, int], cp_model.IntVar] = {}
     snf2_vars: dict[tuple[str, int], cp_model.IntVar] = {}
 
-    eligible_residents = r2s + r3s + r4s
-
+    NF_CODES = {"Sx", "Mnf", "Snf2"}
     for res in eligible_residents:
-        
+        sched = base_schedule.get(res.name, {})
+        # Eligibility: R2 gets Mnf only, R3 gets Mnf+Snf2, R4 gets Snf2 only
+        can_mnf = res.r_year != 4 or rules.r4_mnf_weeks > 0
+        can_snf2 = res.r_year != 2
+
+        # No NF adjacent to existing Sx/Mnf/Snf2 in base schedule
+        # (Snf is excluded — it's packaged with Sx in R2 tracks by design)
+        blocked: set[int] = set()
         for w in range(1, num_weeks + 1):
-            mnf_vars[res.name, w] = model.new_bool_var(f"mnf_{res.name}_{w}")
-            snf2_vars[res.name, w] = model.new_bool_var(f"snf2_{res.name}_{w}")
+            if sched.get(w, "") in NF_CODES:
+                blocked.update((w - 1, w + 1))
+
+        for w in range(1, num_weeks + 1):
+            base_rot = sched.get(w, "")
+            # Hard staffing minimum: pulling would breach the floor
+            if w in blocked or base_rot in frozen_codes.get(w, ()):
+                continue
+            # No Mnf for residents on Vb
+            if can_mnf and base_rot != "Vb":
+                mnf_vars[res.name, w] = model.new_bool_var(f"mnf_{res.name}_{w}")
+            if can_snf2:
+                snf2_vars[res.name, w] = model.new_bool_var(f"snf2_{res.name}_{w}")
 
     # ── Constraints ───────────────────────────────────────────
 
@@ -86,150 +226,92 @@ def solve_night_float(
     for res in eligible_residents:
         forbidden = no_call_weeks.get(res.name, set())
         for w in forbidden:
-            if (res.name, w) in mnf_vars:
-                any_nf = mnf_vars[res.name, w] + snf2_vars[res.name, w]
-                no_call_penalties.append(any_nf * no_call_penalty_weight)
-
-    # 2. Eligibility: R2 gets Mnf only, R3 gets Mnf+Snf2, R4 gets Snf2 only
-    for res in r2s:
-        for w in range(1, num_weeks + 1):
-            model.add(snf2_vars[res.name, w] == 0)  # R2 can't do Snf2
-
-    if rules.r4_mnf_weeks == 0:
-        for res in r4s:
-            for w in range(1, num_weeks + 1):
-                model.add(mnf_vars[res.name, w] == 0)  # R4 can't do Mnf
+            lits = _week_lits(res.name, w, mnf_vars, snf2_vars)
+            if lits:
+                no_call_penalties.append((lits, no_call_penalty_weight))
 
-    # 3. Total NF counts
+    # 2. Total NF counts
     for res in r2s:
         model.add(
-            sum(mnf_vars[res.name, w] for w in range(1, num_weeks + 1))
+            sum(_resident_lits(mnf_vars, res.name, num_weeks))
             == rules.r2_mnf_weeks
         )
 
     for res in r3s:
-        total_nf = sum(
-            mnf_vars[res.name, w] + snf2_vars[res.name, w]
-            for w in range(1, num_weeks + 1)
-        )
+        mnf_lits = _resident_lits(mnf_vars, res.name, num_weeks)
+        snf2_lits = _resident_lits(snf2_vars, res.name, num_weeks)
+        total_nf = sum(mnf_lits) + sum(snf2_lits)
         model.add(total_nf <= rules.r3_max_nf)
         model.add(total_nf >= 1)  # At least 1 NF week
         # Per-shift-type limits for R3
-        model.add(
-            sum(mnf_vars[res.name, w] for w in range(1, num_weeks + 1))
-            <= rules.r3_mnf_max
-        )
-        model.add(
-            sum(snf2_vars[res.name, w] for w in range(1, num_weeks + 1))
-            <= rules.r3_snf2_max
-        )
+        model.add(sum(mnf_lits) <= rules.r3_mnf_max)
+        model.add(sum(snf2_lits) <= rules.r3_snf2_max)
 
     for res in r4s:
         model.add(
-            sum(snf2_vars[res.name, w] for w in range(1, num_weeks + 1))
+            sum(_resident_lits(snf2_vars, res.name, num_weeks))
             == rules.r4_snf2_weeks
         )
         if rules.r4_mnf_weeks > 0:
             model.add(
-                sum(mnf_vars[res.name, w] for w in range(1, num_weeks + 1))
+                sum(_resident_lits(mnf_vars, res.name, num_weeks))
                 == rules.r4_mnf_weeks
             )
 
-    # 4. No double-assignment: can't have both Mnf and Snf2 in same week
+    # 3. No double-assignment (Mnf and Snf2 in the same week) and
+    #    minimum spacing between NF weeks for the same resident.
+    #    Two NF weeks closer than min_spacing_weeks always fall in a
+    #    common window of that width, so one AtMostOne over the Mnf and
+    #    Snf2 literals of each sliding window covers both rules.
+    span = min(max(1, rules.min_spacing_weeks), num_weeks)
     for res in eligible_residents:
-        for w in range(1, num_weeks + 1):
-            model.add(mnf_vars[res.name, w] + snf2_vars[res.name, w] <= 1)
-
-    # 5. Minimum spacing between NF weeks for same resident
-    for res in eligible_residents:
-        for w in range(1, num_weeks + 1):
-            any_nf_w = mnf_vars[res.name, w] + snf2_vars[res.name, w]
-            for w2 in range(w + 1, min(w + rules.min_spacing_weeks, num_weeks + 1)):
-                any_nf_w2 = mnf_vars[res.name, w2] + snf2_vars[res.name, w2]
-                model.add(any_nf_w + any_nf_w2 <= 1)
-
-    # 5b. No NF adjacent to existing Sx/Mnf/Snf2 in base schedule
-    #     (Snf is excluded — it's packaged with Sx in R2 tracks by design)
-    NF_CODES = {"Sx", "Mnf", "Snf2"}
-    for res in eligible_residents:
-        sched = base_schedule.get(res.name, {})
-        for w in range(1, num_weeks + 1):
-            if sched.get(w, "") in NF_CODES:
-                # Forbid solver-assigned NF in adjacent weeks
-                for w2 in range(max(1, w - 1), min(num_weeks, w + 1) + 1):
-                    if w2 == w:
-                        continue
-                    if (res.name, w2) in mnf_vars:
-                        model.add(mnf_vars[res.name, w2] == 0)
-                        model.add(snf2_vars[res.name, w2] == 0)
-
-    # 5c. No Mnf for residents on Vb (hard constraint)
-    for res in eligible_residents:
-        sched = base_schedule.get(res.name, {})
-        for w in range(1, num_weeks + 1):
-            if sched.get(w, "") == "Vb":
-                model.add(mnf_vars[res.name, w] == 0)
-
-    # 6. Locked assignments
+        for start in range(1, num_weeks - span + 2):
+            window_lits = [
+                lit
+                for w in range(start, start + span)
+                for lit in _week_lits(res.name, w, mnf_vars, snf2_vars)
+            ]
+            if len(window_lits) > 1:
+                model.add_at_most_one(window_lits)
+
+    # 4. Locked assignments (a lock on a structurally impossible slot
+    #    makes the model infeasible, as an == 0 / == 1 pair would)
+    eligible_names = {res.name for res in eligible_residents}
     for name, locked in locked_assignments.items():
+        if name not in eligible_names:
+            continue
         for week, code in locked:
-            if code == "Mnf" and (name, week) in mnf_vars:
-                model.add(mnf_vars[name, week] == 1)
-            elif code == "Snf2" and (name, week) in snf2_vars:
-                model.add(snf2_vars[name, week] == 1)
+            var_map = {"Mnf": mnf_vars, "Snf2": snf2_vars}.get(code)
+            if var_map is None:
+                continue
+            if (name, week) in var_map:
+                model.add(var_map[name, week] == 1)
+            else:
+                model.add(False)
 
-    # 7. Per-week exclusivity: at most 1 Mnf and 1 Snf2 across all residents
+    # 5. Per-week exclusivity: at most 1 Mnf and 1 Snf2 across all residents
     for w in range(1, num_weeks + 1):
-        model.add(sum(mnf_vars[res.name, w] for res in eligible_residents) <= 1)
-        model.add(sum(snf2_vars[res.name, w] for res in eligible_residents) <= 1)
+        model.add(sum(_week_lits_all(eligible_residents, w, mnf_vars)) <= 1)
+        model.add(sum(_week_lits_all(eligible_residents, w, snf2_vars)) <= 1)
 
-    # 8. Coverage: try to have at least 1 Mnf and 1 Snf2 each week
+    # 6. Coverage: try to have at least 1 Mnf and 1 Snf2 each week
     # (soft constraint via objective)
 
-    # ── Staffing hard constraints + objective ─────────────────
-    # Build reverse map: rotation_code → rotation_label for staffing lookup
-    _code_to_labels: dict[str, list[str]] = {}
-    _label_to_min: dict[str, int] = {}
-    _label_to_codes: dict[str, set[str]] = {}
-    if staffing_snapshot:
-        if staffing_constraints:
-            for sc in staffing_constraints:
-                for c in sc.rotation_codes:
-                    _code_to_labels.setdefault(c, []).append(sc.label)
-                _label_to_min[sc.label] = sc.min_count
-                _label_to_codes[sc.label] = sc.rotation_codes
-        else:
-            for label, (codes, _min_req) in ROTATION_MINIMUMS.items():
-                for c in codes:
-                    _code_to_labels.setdefault(c, []).append(label)
-                _label_to_min[label] = _min_req
-                _label_to_codes[label] = codes
+    # 7. Hard staffing maximum constraint: total NF assignments per
+    #    week must not exceed the maximum for Mnf/Snf2 (already
+    #    enforced by constraint 5 — at most 1 each per week)
 
-    # 9. Hard staffing minimum constraint: forbid NF if pulling would
-    #    drop base rotation below minimum staffing for that week
-    if staffing_snapshot:
-        for w in range(1, num_weeks + 1):
-            week_staffing = staffing_snapshot.get(w, {})
-            # For each staffing group, count how many eligible residents
-            # on that rotation could be pulled.  If pulling ANY of them
-            # would breach the minimum, forbid all of them.
-            for label, min_req in _label_to_min.items():
-                if min_req <= 0:
-                    continue
-                current = week_staffing.get(label, 0)
-                if current <= min_req:
-                    # Already at or below minimum — forbid pulling anyone
-                    # whose base rotation is in this group
-                    codes = _label_to_codes.get(label, set())
-                    for res in eligible_residents:
-                        sched = base_schedule.get(res.name, {})
-                        if sched.get(w, "") in codes:
-                            model.add(mnf_vars[res.name, w] == 0)
-                            model.add(snf2_vars[res.name, w] == 0)
-
-    # 10. Hard staffing maximum constraint: total NF assignments per
-    #     week must not exceed the maximum for Mnf/Snf2 (already
-    #     enforced by constraint 7 — at most 1 each per week)
+    # Warm start: hint a greedy placement of the required NF weeks so the
+    # search starts near a feasible assignment.  CP-SAT already derives
+    # the objective's bounds from the literals, so no explicit obj var.
+    hinted = _greedy_hint(
+        eligible_residents, base_schedule, rules, num_weeks,
+        {"Mnf": mnf_vars, "Snf2": snf2_vars}, locked_assignments,
+    )
+    for (name, w), var in mnf_vars.items():
+        model.add_hint(var, (name, w, "Mnf") in hinted)
+    for (name, w), var in snf2_vars.items():
+        model.add_hint(var, (name, w, "Snf2") in hinted)
 
     # ── Objective ─────────────────────────────────────────────
     # Prefer pulling from "easy" rotations (Pcmb, Mb, Mucic, Peds, Mnuc)
@@ -240,12 +322,14 @@ def solve_night_float(
     for res in eligible_residents:
         sched = base_schedule.get(res.name, {})
         for w in range(1, num_weeks + 1):
+            lits = _week_lits(res.name, w, mnf_vars, snf2_vars)
+            if not lits:
+                continue
             base_rot = sched.get(w, "")
-            any_nf = mnf_vars[res.name, w] + snf2_vars[res.name, w]
             if base_rot in rules.preferred_pull_rotations:
-                pull_bonus.append(any_nf * 10)  # bonus for pulling from preferred
+                pull_bonus.append((lits, 10))  # bonus for pulling from preferred
             elif base_rot:
-                pull_bonus.append(any_nf * (-5))  # penalty for pulling from others
+                pull_bonus.append((lits, -5))  # penalty for pulling from others
 
             # Soft staffing penalty: discourage pulling from rotations
             # near minimum (at min+1) even though it's technically allowed
@@ -258,7 +342,7 @@ def solve_night_float(
                         if min_req is None and label in ROTATION_MINIMUMS:
                             min_req = ROTATION_MINIMUMS[label][1]
                         if min_req is not None and current <= min_req + 1:
-                            staffing_penalties.append(any_nf * staffing_penalty_weight)
+                            staffing_penalties.append((lits, staffing_penalty_weight))
 
     # Holiday soft constraints: penalize NF on holidays the resident doesn't prefer
     holiday_penalties = []
@@ -280,9 +364,9 @@ def solve_night_float(
                 total_penalty = penalty_for_pref + penalty_for_history
                 if total_penalty > 0:
                     for w in weeks:
-                        if (res.name, w) in mnf_vars:
-                            any_nf = mnf_vars[res.name, w] + snf2_vars[res.name, w]
-                            holiday_penalties.append(any_nf * total_penalty)
+                        lits = _week_lits(res.name, w, mnf_vars, snf2_vars)
+                        if lits:
+                            holiday_penalties.append((lits, total_penalty))
 
     # No-call weekend buffer: penalize weeks adjacent to no-call dates
     buffer_penalties = []
@@ -291,9 +375,9 @@ def solve_night_float(
         for w in forbidden:
             for adj in (w - 1, w + 1):
                 if 1 <= adj <= num_weeks and adj not in forbidden:
-                    if (res.name, adj) in mnf_vars:
-                        any_nf = mnf_vars[res.name, adj] + snf2_vars[res.name, adj]
-                        buffer_penalties.append(any_nf * nocall_buffer_weight)
+                    lits = _week_lits(res.name, adj, mnf_vars, snf2_vars)
+                    if lits:
+                        buffer_penalties.append((lits, nocall_buffer_weight))
 
     # NF timing preferences from resident comments
     timing_penalties = []
@@ -303,34 +387,44 @@ def solve_night_float(
         if not pref:
             continue
         for w in range(1, num_weeks + 1):
-            if (res.name, w) not in mnf_vars:
+            lits = _week_lits(res.name, w, mnf_vars, snf2_vars)
+            if not lits:
                 continue
-            any_nf = mnf_vars[res.name, w] + snf2_vars[res.name, w]
             if pref == "avoid-july" and w <= 4:
-                timing_penalties.append(any_nf * nf_timing_weight)
+                timing_penalties.append((lits, nf_timing_weight))
             elif pref == "early-holidays-ok":
                 if w <= 20:
-                    timing_penalties.append(any_nf * (-nf_timing_weight))  # bonus
+                    timing_penalties.append((lits, -nf_timing_weight))  # bonus
                 elif w > 40:
-                    timing_penalties.append(any_nf * nf_timing_weight)
+                    timing_penalties.append((lits, nf_timing_weight))
             elif pref == "late" and w <= 16:
-                timing_penalties.append(any_nf * nf_timing_weight)
+                timing_penalties.append((lits, nf_timing_weight))
             elif pref == "late-fall":
                 if w <= 16 or w > 36:
-                    timing_penalties.append(any_nf * nf_timing_weight)
+                    timing_penalties.append((lits, nf_timing_weight))
             elif pref == "avoid-core-adjacent" and w >= 41:
-                timing_penalties.append(any_nf * nf_timing_weight)
+                timing_penalties.append((lits, nf_timing_weight))
             elif pref == "holidays-ok":
                 pass  # no timing penalty; holiday penalties already handle the bonus
 
-    model.maximize(
-        sum(pull_bonus) - sum(staffing_penalties) - sum(no_call_penalties)
-        - sum(holiday_penalties) - sum(buffer_penalties) - sum(timing_penalties)
-    )
+    # Each term is (literals, weight); flatten into one weighted sum so the
+    # objective goes to CP-SAT as parallel arrays, not a nested expression.
+    obj_vars: list[cp_model.IntVar] = []
+    obj_coeffs: list[int] = []
+    for terms, sign in (
+        (pull_bonus, 1), (staffing_penalties, -1), (no_call_penalties, -1),
+        (holiday_penalties, -1), (buffer_penalties, -1), (timing_penalties, -1),
+    ):
+        for lits, weight in terms:
+            obj_vars.extend(lits)
+            obj_coeffs.extend([sign * weight] * len(lits))
+    model.maximize(cp_model.LinearExpr.weighted_sum(obj_vars, obj_coeffs))
 
     # ── Solve ─────────────────────────────────────────────────
     solver = cp_model.CpSolver()
     solver.parameters.max_time_in_seconds = 60
+    solver.parameters.num_workers = DEFAULT_NUM_WORKERS if num_workers is None else num_workers
+    solver.parameters.log_search_progress = log_search_progress
     status = solver.solve(model)
 
     result = NFAssignmentResult(
@@ -342,9 +436,9 @@ def solve_night_float(
         for res in eligible_residents:
             nf_list = []
             for w in range(1, num_weeks + 1):
-                if solver.value(mnf_vars[res.name, w]) == 1:
+                if (res.name, w) in mnf_vars and solver.value(mnf_vars[res.name, w]):
                     nf_list.append((w, "Mnf"))
-                elif solver.value(snf2_vars[res.name, w]) == 1:
+                elif (res.name, w) in snf2_vars and solver.value(snf2_vars[res.name, w]):
                     nf_list.append((w, "Snf2"))
             if nf_list:
                 result.assignments[res.name] = nf_list
@@ -353,14 +447,13 @@ def solve_night_float(
         for res in eligible_residents:
             forbidden = no_call_weeks.get(res.name, set())
             for w in forbidden:
-                if (res.name, w) in mnf_vars:
-                    if solver.value(mnf_vars[res.name, w]) == 1:
-                        result.violations.append(
-                            f"{res.name}: Mnf assigned on no-call week {w}"
-                        )
-                    elif solver.value(snf2_vars[res.name, w]) == 1:
-                        result.violations.append(
-                            f"{res.name}: Snf2 assigned on no-call week {w}"
-                        )
+                if (res.name, w) in mnf_vars and solver.value(mnf_vars[res.name, w]):
+                    result.violations.append(
+                        f"{res.name}: Mnf assigned on no-call week {w}"
+                    )
+                elif (res.name, w) in snf2_vars and solver.value(snf2_vars[res.name, w]):
+                    result.violations.append(
+                        f"{res.name}: Snf2 assigned on no-call week {w}"
+                    )
 
     return result
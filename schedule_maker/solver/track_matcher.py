@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from ortools.sat.python import cp_model
 
 from schedule_maker.models.resident import Resident
+from schedule_maker.solver.config import DEFAULT_NUM_WORKERS
 
 
 @dataclass
@@ -24,6 +25,8 @@ def solve_track_assignment(
     residents: list[Resident],
     num_tracks: int,
     max_rank: int | None = None,
+    num_workers: int | None = None,
+    log_search_progress: bool = False,
 ) -> TrackAssignmentResult:
     """Solve optimal 1:1 resident→track assignment minimizing total rank penalty.
 
@@ -33,6 +36,8 @@ def solve_track_assignment(
         residents: list of residents with track_prefs.rankings populated
         num_tracks: number of available tracks (typically 15)
         max_rank: optional hard constraint on maximum allowed rank
+        num_workers: CP-SAT search workers (default DEFAULT_NUM_WORKERS; 0 = all cores)
+        log_search_progress: print CP-SAT search log to stdout
 
     Returns:
         TrackAssignmentResult with optimal assignments
@@ -49,13 +54,16 @@ def solve_track_assignment(
 
     # Constraint: each resident gets exactly one track
     for i in range(n):
-        model.add(sum(x[i, j] for j in range(1, num_tracks + 1)) == 1)
+        model.add_exactly_one(x[i, j] for j in range(1, num_tracks + 1))
 
     # Constraint: each track gets limited residents
     # If n > num_tracks, allow up to ceil(n/num_tracks) per track
     max_per_track = (n + num_tracks - 1) // num_tracks  # ceiling division
     for j in range(1, num_tracks + 1):
-        model.add(sum(x[i, j] for i in range(n)) <= max_per_track)
+        if max_per_track == 1:
+            model.add_at_most_one(x[i, j] for i in range(n))
+        else:
+            model.add(sum(x[i, j] for i in range(n)) <= max_per_track)
 
     # When n > num_tracks, ensure every track has at least 1 resident.
     # This minimizes the number of duplicate tracks (exactly n - num_tracks),
@@ -65,6 +73,20 @@ def solve_track_assignment(
         for j in range(1, num_tracks + 1):
             model.add(sum(x[i, j] for i in range(n)) >= 1)
 
+    # Symmetry breaking: residents with identical rankings are
+    # interchangeable, so fix their relative order (track numbers
+    # non-decreasing in input order) instead of searching every permutation.
+    same_prefs: dict[tuple, list[int]] = {}
+    for i, res in enumerate(residents):
+        rankings = res.track_prefs.rankings if res.track_prefs else {}
+        same_prefs.setdefault(tuple(sorted(rankings.items())), []).append(i)
+    for group in same_prefs.values():
+        for a, b in zip(group, group[1:]):
+            model.add(
+                sum(j * x[a, j] for j in range(1, num_tracks + 1))
+                <= sum(j * x[b, j] for j in range(1, num_tracks + 1))
+            )
+
     # Optional: max rank constraint
     if max_rank is not None:
         for i, res in enumerate(residents):
@@ -92,6 +114,12 @@ def solve_track_assignment(
     # Solve
     solver = cp_model.CpSolver()
     solver.parameters.max_time_in_seconds = 30
+    solver.parameters.num_workers = DEFAULT_NUM_WORKERS if num_workers is None else num_workers
+    # The model is a few hundred Booleans; probing and LP relaxation
+    # cost more than the search itself at this size.
+    solver.parameters.cp_model_probing_level = 0
+    solver.parameters.linearization_level = 0
+    solver.parameters.log_search_progress = log_search_progress
     status = solver.solve(model)
 
     result = TrackAssignmentResult(
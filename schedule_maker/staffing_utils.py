@@ -6,7 +6,9 @@ import math
 import random as _random
 
 from schedule_maker.models.schedule import ScheduleGrid
-from schedule_maker.models.rotation import fse_to_base_code
+from schedule_maker.models.rotation import (
+    HospitalSystem, fse_to_base_code, get_hospital_system, with_fse_aliases,
+)
 from schedule_maker.models.constraints import StaffingConstraint
 from schedule_maker.validation.staffing import ROTATION_MINIMUMS, ROTATION_MAXIMUMS
 
@@ -195,6 +197,21 @@ def block_has_nf(schedule: dict[int, str], block: int, grid: ScheduleGrid,
     return False
 
 
+def has_hospital_conflict(schedule: dict[int, str], block: int, code: str) -> bool:
+    """Check if assigning ``code`` to ``block`` mixes hospital systems within the block."""
+    target = get_hospital_system(code)
+    if target == HospitalSystem.OTHER:
+        return False
+    start = (block - 1) * 4 + 1
+    for w in range(start, start + 4):
+        existing = schedule.get(w)
+        if existing:
+            existing_system = get_hospital_system(existing)
+            if existing_system != HospitalSystem.OTHER and existing_system != target:
+                return True
+    return False
+
+
 def block_exceeds_max(grid: ScheduleGrid, block: int, code: str, default_max: int = 6) -> bool:
     """Check if assigning ``code`` to ``block`` would exceed its max staffing cap.
 
@@ -205,29 +222,20 @@ def block_exceeds_max(grid: ScheduleGrid, block: int, code: str, default_max: in
     # Resolve FSE → base code so FSE-Bre counts against Pcbi cap, etc.
     effective = fse_to_base_code(code)
 
-    # Find the matching max group (if any)
+    # Find the matching max group (if any); with no explicit group, count
+    # exact code matches.  Either way FSE variants count via their aliases.
     max_allowed = default_max
-    matched_codes: set[str] | None = None
+    matched_codes = frozenset({effective})
     for _label, (codes, cap) in ROTATION_MAXIMUMS.items():
         if effective in codes:
             max_allowed = cap
             matched_codes = codes
             break
+    counted = with_fse_aliases(matched_codes)
 
-    weeks = list(grid.block_to_weeks(block))
-    for w in weeks:
+    for w in grid.block_to_weeks(block):
         assignments = grid.get_week_assignments(w)
-        if matched_codes is not None:
-            count = sum(
-                1 for c in assignments.values()
-                if c in matched_codes or fse_to_base_code(c) in matched_codes
-            )
-        else:
-            # No explicit group — count exact code matches (+ FSE variants)
-            count = sum(
-                1 for c in assignments.values()
-                if c == effective or fse_to_base_code(c) == effective
-            )
+        count = sum(1 for c in assignments.values() if c in counted)
         if count >= max_allowed:
             return True
     return False
@@ -304,16 +312,16 @@ def build_fill_candidates(
                 "Msamp", "Msampler",
                 "Vch", "Vn", "Vnuc"}  # retired rotations
     candidates = list(base or ["Mai", "Mch", "Mus", "Mucic", "Mb", "Ser"])
+    seen = set(candidates)
     if constraints:
-        for sc in constraints:
-            for code in sc.rotation_codes:
-                if code not in candidates and code not in excluded and not is_night_float(code):
-                    candidates.append(code)
+        code_groups = [sc.rotation_codes for sc in constraints]
     else:
-        for _label, (codes, _min) in ROTATION_MINIMUMS.items():
-            for code in codes:
-                if code not in candidates and code not in excluded and not is_night_float(code):
-                    candidates.append(code)
+        code_groups = [codes for codes, _min in ROTATION_MINIMUMS.values()]
+    for codes in code_groups:
+        for code in codes:
+            if code not in seen and code not in excluded and not is_night_float(code):
+                candidates.append(code)
+                seen.add(code)
     # Filter out rotations not eligible for this R-year
     if r_year is not None:
         candidates = [
@@ -11,7 +11,7 @@ from schedule_maker.models.rotation import (
     ROTATION_SECTION, Section, get_hospital_system, HospitalSystem, fse_to_base_code,
 )
 from schedule_maker.models.constraints import StaffingConstraint
-from schedule_maker.validation.staffing import check_staffing, staffing_summary, ROTATION_MINIMUMS
+from schedule_maker.validation.staffing import check_staffing_and_summary, ROTATION_MINIMUMS
 from schedule_maker.validation.graduation import check_graduation
 from schedule_maker.validation.hospital_conflict import check_hospital_conflicts
 from schedule_maker.phases.r4_builder import HOSPITAL_CONFLICT_EXEMPT
@@ -164,7 +164,11 @@ def generate_equity_report(
 
     # ── 4. Staffing Balance ───────────────────────────────────
     lines.append("\n## 4. STAFFING BALANCE")
-    violations = check_staffing(grid, num_weeks, constraints=staffing_constraints)
+    week_assignments = grid.get_all_week_assignments()
+    violations, summary = check_staffing_and_summary(
+        grid, num_weeks, constraints=staffing_constraints,
+        week_assignments=week_assignments,
+    )
     under = [v for v in violations if v.is_under]
     over = [v for v in violations if not v.is_under]
     lines.append(f"  Under-minimum violations: {len(under)}")
@@ -181,7 +185,7 @@ def generate_equity_report(
     for label, codes, min_req in min_entries:
         weekly_counts: list[int] = []
         for w in range(1, num_weeks + 1):
-            assignments = grid.get_week_assignments(w)
+            assignments = week_assignments.get(w, {})
             count = sum(1 for c in assignments.values()
                         if c in codes or fse_to_base_code(c) in codes)
             weekly_counts.append(count)
@@ -193,7 +197,6 @@ def generate_equity_report(
             )
 
     # Per hospital system
-    summary = staffing_summary(grid, num_weeks)
     lines.append("  Per-system staffing (residents/week):")
     for label, stats in summary.items():
         lines.append(
@@ -209,8 +212,8 @@ def generate_equity_report(
     # Build requirement progress per resident
     for yr in sorted(by_year):
         group = by_year[yr]
-        yr_deficits = [d for d in deficits
-                       if any(r.name == d.resident_name and r.r_year == yr for r in group)]
+        group_names = {r.name for r in group}
+        yr_deficits = [d for d in deficits if d.resident_name in group_names]
         deficit_count = len(set(d.resident_name for d in yr_deficits))
         lines.append(f"  R{yr}: {deficit_count}/{len(group)} residents with graduation deficits")
         # Group by requirement type
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 
 from schedule_maker.models.resident import Resident, Pathway
@@ -9,6 +10,12 @@ from schedule_maker.models.constraints import GraduationRequirements, STANDARD_G
 from schedule_maker.models.rotation import NM_PARTIAL_CREDIT_ROTATIONS, NM_PARTIAL_RATIO
 
 
+BREAST_CODES = frozenset({"Pcbi", "Sbi"})
+NM_CODES = frozenset({"Mnuc", "Vnuc"})
+IR_CODES = frozenset({"Mir", "Zir", "Sir", "Vir"})
+NEURO_CODES = frozenset({"Mucic", "Smr"})
+
+
 @dataclass
 class GradDeficit:
     resident_name: str
@@ -39,16 +46,12 @@ def check_graduation(
         if check_r4_only and res.r_year != 4:
             continue
 
-        # Count current year rotation weeks from schedule
-        current_weeks: dict[str, float] = {}
-        for week, code in res.schedule.items():
-            if code:
-                current_weeks[code] = current_weeks.get(code, 0) + 1
+        # History + current year rotation weeks, per code
+        totals = Counter(res.history)
+        totals.update(code for code in res.schedule.values() if code)
 
         # Check breast imaging (12 weeks across residency)
-        breast_codes = {"Pcbi", "Sbi"}
-        breast_total = sum(res.history.get(c, 0) + current_weeks.get(c, 0)
-                          for c in breast_codes)
+        breast_total = sum(totals[c] for c in BREAST_CODES)
         if breast_total < 12:
             deficits.append(GradDeficit(
                 resident_name=res.name,
@@ -59,13 +62,12 @@ def check_graduation(
             ))
 
         # Check nuclear medicine
-        nm_codes = {"Mnuc", "Vnuc"}
-        nm_total = sum(res.history.get(c, 0) + current_weeks.get(c, 0) for c in nm_codes)
+        nm_total = sum(totals[c] for c in NM_CODES)
 
         if res.is_nrdr:
             # NRDR: 48 weeks, NO partial credit from clinical rotations,
             # but research months count toward requirement
-            res_weeks = res.history.get("Res", 0) + current_weeks.get("Res", 0)
+            res_weeks = totals["Res"]
             nm_with_res = nm_total + res_weeks
             if nm_with_res < 48:
                 deficits.append(GradDeficit(
@@ -78,7 +80,7 @@ def check_graduation(
         else:
             # Non-NRDR: 16 weeks, with 4:1 partial credit
             partial = sum(
-                (res.history.get(c, 0) + current_weeks.get(c, 0)) * NM_PARTIAL_RATIO
+                totals[c] * NM_PARTIAL_RATIO
                 for c in NM_PARTIAL_CREDIT_ROTATIONS
             )
             nm_with_partial = nm_total + partial
@@ -93,8 +95,7 @@ def check_graduation(
 
         # ESIR: 12 weeks IR
         if res.is_esir:
-            ir_codes = {"Mir", "Zir", "Sir", "Vir"}
-            ir_total = sum(res.history.get(c, 0) + current_weeks.get(c, 0) for c in ir_codes)
+            ir_total = sum(totals[c] for c in IR_CODES)
             if ir_total < 12:
                 deficits.append(GradDeficit(
                     resident_name=res.name,
@@ -106,9 +107,7 @@ def check_graduation(
 
         # ESNR: 6 blocks (24 weeks) neuro in R4, max 1 on Smr
         if res.is_esnr:
-            neuro_codes = {"Mucic", "Smr"}
-            neuro_total = sum(res.history.get(c, 0) + current_weeks.get(c, 0)
-                             for c in neuro_codes)
+            neuro_total = sum(totals[c] for c in NEURO_CODES)
             if neuro_total < 24:
                 deficits.append(GradDeficit(
                     resident_name=res.name,
@@ -140,8 +139,7 @@ def compute_r34_recs(residents: list[Resident]) -> None:
         rec: dict[str, float] = {}
 
         # ── Breast deficit ──
-        breast_codes = {"Pcbi", "Sbi"}
-        breast_total = sum(res.history.get(c, 0) for c in breast_codes)
+        breast_total = sum(res.history.get(c, 0) for c in BREAST_CODES)
         breast_deficit = max(0, 12 - breast_total)
         if breast_deficit > 0:
             breast_blocks = math.ceil(breast_deficit / 4)
@@ -149,8 +147,7 @@ def compute_r34_recs(residents: list[Resident]) -> None:
             deficient.append("Pcbi")
 
         # ── NucMed deficit ──
-        nm_codes = {"Mnuc", "Vnuc"}
-        nm_total = sum(res.history.get(c, 0) for c in nm_codes)
+        nm_total = sum(res.history.get(c, 0) for c in NM_CODES)
 
         if res.is_nrdr:
             # NRDR: 48 weeks, research counts, no partial credit
@@ -177,8 +174,7 @@ def compute_r34_recs(residents: list[Resident]) -> None:
 
         # ── ESIR deficit ──
         if res.is_esir:
-            ir_codes = {"Mir", "Zir", "Sir", "Vir"}
-            ir_total = sum(res.history.get(c, 0) for c in ir_codes)
+            ir_total = sum(res.history.get(c, 0) for c in IR_CODES)
             ir_deficit = max(0, 12 - ir_total)
             if ir_deficit > 0:
                 if res.r_year == 4:
@@ -194,8 +190,7 @@ def compute_r34_recs(residents: list[Resident]) -> None:
 
         # ── ESNR deficit ──
         if res.is_esnr:
-            neuro_codes = {"Mucic", "Smr"}
-            neuro_total = sum(res.history.get(c, 0) for c in neuro_codes)
+            neuro_total = sum(res.history.get(c, 0) for c in NEURO_CODES)
             neuro_deficit = max(0, 24 - neuro_total)
             if neuro_deficit > 0 and res.r_year == 4:
                 # 6 blocks neuro, max 1 on Smr
@@ -39,34 +39,27 @@ def check_hospital_conflicts(
             # Hospital conflicts within a biweek are the real issue
             # (different rotations in the same 2-week period at different sites)
             for biweek_start in (start_week, start_week + 2):
-                systems_seen: dict[HospitalSystem, list[str]] = {}
+                codes = [res.schedule.get(w, "") for w in (biweek_start, biweek_start + 1)]
+                # Same rotation both weeks (the common case) can't conflict
+                if codes[0] == codes[1]:
+                    continue
 
-                for w in range(biweek_start, biweek_start + 2):
-                    code = res.schedule.get(w, "")
+                systems_seen: dict[HospitalSystem, list[str]] = {}
+                for code in codes:
                     if not code:
                         continue
-
                     system = get_hospital_system(code)
                     if system == HospitalSystem.OTHER:
                         continue
+                    systems_seen.setdefault(system, []).append(code)
 
-                    if system not in systems_seen:
-                        systems_seen[system] = []
-                    systems_seen[system].append(code)
-
-                # Check if multiple systems present in this biweek
-                real_systems = {s: codes for s, codes in systems_seen.items()
-                                if s != HospitalSystem.OTHER}
-                if len(real_systems) > 1:
-                    all_codes = []
-                    for codes in real_systems.values():
-                        all_codes.extend(codes)
-                    biweek_label = "A" if biweek_start == start_week else "B"
+                # OTHER is skipped above, so every key is a real system
+                if len(systems_seen) > 1:
                     conflicts.append(HospitalConflict(
                         resident_name=res.name,
                         block=block,
-                        systems={s.value for s in real_systems},
-                        rotations=all_codes,
+                        systems={s.value for s in systems_seen},
+                        rotations=[c for cs in systems_seen.values() for c in cs],
                     ))
 
     return conflicts
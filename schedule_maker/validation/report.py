@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
+from collections import Counter
+
 from schedule_maker.models.resident import Resident
 from schedule_maker.models.schedule import ScheduleGrid
 from schedule_maker.models.constraints import StaffingConstraint
-from schedule_maker.validation.staffing import check_staffing, staffing_summary, StaffingViolation
+from schedule_maker.validation.staffing import check_staffing_and_summary, StaffingViolation
 from schedule_maker.validation.graduation import check_graduation, GradDeficit
 from schedule_maker.validation.hospital_conflict import check_hospital_conflicts, HospitalConflict
 from schedule_maker.phases.r4_builder import HOSPITAL_CONFLICT_EXEMPT
@@ -32,8 +35,10 @@ def generate_report(
     lines.append("SCHEDULE VALIDATION REPORT")
     lines.append("=" * 70)
 
-    # 1. Staffing
-    staffing_violations = check_staffing(grid, num_weeks, constraints=staffing_constraints)
+    # 1. Staffing (violations and per-site summary in one pass)
+    staffing_violations, summary = check_staffing_and_summary(
+        grid, num_weeks, constraints=staffing_constraints,
+    )
     under_violations = [v for v in staffing_violations if v.is_under]
     over_violations = [v for v in staffing_violations if not v.is_under]
     lines.append(f"\n## STAFFING ({len(under_violations)} under-minimum, {len(over_violations)} over-maximum violations)")
@@ -58,7 +63,6 @@ def generate_report(
             lines.append(f"  ... and {len(over_violations) - 20} more")
 
     # Staffing summary by site
-    summary = staffing_summary(grid, num_weeks)
     lines.append("\n  Site Staffing Summary (residents/week):")
     for label, stats in summary.items():
         lines.append(
@@ -80,9 +84,9 @@ def generate_report(
 
     # 2. Graduation
     grad_deficits = check_graduation(residents, check_r4_only=False)
-    r4_deficits = [d for d in grad_deficits
-                   if any(r.name == d.resident_name and r.r_year == 4 for r in residents)]
-    other_deficits = [d for d in grad_deficits if d not in r4_deficits]
+    r4_names = {r.name for r in residents if r.r_year == 4}
+    r4_deficits = [d for d in grad_deficits if d.resident_name in r4_names]
+    other_deficits = [d for d in grad_deficits if d.resident_name not in r4_names]
 
     lines.append(f"\n## GRADUATION REQUIREMENTS — R4 ({len(r4_deficits)} deficits)")
     if r4_deficits:
@@ -124,17 +128,14 @@ def generate_report(
         for v in nf_violations:
             lines.append(f"  {v}")
     lines.append("\n## NIGHT FLOAT SUMMARY")
+    nf_by_res = Counter(name for name, _w in grid.nf_assignments)
     for r_year in [2, 3, 4]:
         year_residents = [r for r in residents if r.r_year == r_year]
-        nf_counts = []
-        for res in year_residents:
-            nf_weeks = sum(1 for w, code in grid.nf_assignments.items()
-                           if w[0] == res.name)
-            nf_counts.append((res.name, nf_weeks))
+        nf_counts = [(res.name, nf_by_res[res.name]) for res in year_residents]
         if nf_counts:
             avg = sum(c for _, c in nf_counts) / len(nf_counts) if nf_counts else 0
             lines.append(f"  R{r_year}: avg {avg:.1f} NF weeks/resident")
-            for name, count in sorted(nf_counts, key=lambda x: -x[1])[:5]:
+            for name, count in heapq.nlargest(5, nf_counts, key=lambda x: x[1]):
                 lines.append(f"    {name}: {count} weeks")
 
     # 5. Coverage summary
@@ -214,7 +215,7 @@ def generate_preference_report(
             top3_str = "?"
             if res and res.track_prefs and res.track_prefs.rankings:
                 inv = {v: k for k, v in res.track_prefs.rankings.items()}
-                top3_tracks = [str(inv[r]) for r in sorted(inv)[:3]]
+                top3_tracks = [str(inv[r]) for r in heapq.nsmallest(3, inv)]
                 top3_str = ", ".join(top3_tracks)
             lines.append(f"  {name}: Track {track} (rank #{rank}) — top 3 choices: [{top3_str}]")
             if isinstance(rank, int):
@@ -264,7 +265,7 @@ def generate_preference_report(
         for res in sorted(r3_airp, key=lambda r: r.name):
             assigned = r3_meta.get(res.name, {}).get("airp_session", "?")
             inv = {v: k for k, v in res.airp_prefs.rankings.items()}
-            top_choices = [inv[r] for r in sorted(inv)[:3] if r in inv]
+            top_choices = [inv[r] for r in heapq.nsmallest(3, inv) if r in inv]
             rank_of_assigned = res.airp_prefs.rankings.get(assigned)
             if rank_of_assigned and rank_of_assigned <= 3:
                 fulfilled_count += 1
@@ -709,7 +710,7 @@ def generate_satisfaction_report(
                         pos_weeks += 1
                     elif scores[code] < 0:
                         neg_weeks += 1
-            rot_str = ", ".join(f"{c} x{n}wk" for c, n in sorted(rot_counts.items(), key=lambda x: -x[1])[:6])
+            rot_str = ", ".join(f"{c} x{n}wk" for c, n in heapq.nlargest(6, rot_counts.items(), key=lambda x: x[1]))
             lines.append(f"  Assigned: {rot_str}")
             if scored_weeks:
                 total_clin = sum(rot_counts.values())
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 
 from schedule_maker.models.schedule import ScheduleGrid
@@ -21,68 +22,112 @@ class StaffingViolation:
 
 
 # Per-rotation minimum requirements derived from Base Schedule rows 101-151.
-# Format: label → (set of rotation codes, minimum required)
+# Format: label → (frozenset of rotation codes, minimum required)
 # Updated for 2026-2027 spreadsheet layout.
-ROTATION_MINIMUMS: dict[str, tuple[set[str], int]] = {
+ROTATION_MINIMUMS: dict[str, tuple[frozenset[str], int]] = {
     # ── Group-level minimums (all R-years) ──
-    "Moffitt AI": ({"Mai", "Zai"}, 3),
-    "Moffitt US": ({"Mus"}, 2),
-    "Moffitt Cardiothoracic": ({"Mch", "Mch2", "Mc"}, 2),
-    "Peds": ({"Peds"}, 1),
-    "Moffitt Neuro": ({"Mucic", "Mnct"}, 3),
-    "Moffitt Bone": ({"Mb"}, 1),
-    "Moffitt Nucs": ({"Mnuc"}, 2),
-    "PCMB Breast": ({"Pcbi"}, 1),
-    "ZSFG Total": ({"Ser", "Smr", "Sbi", "Sir", "Sus", "Sai", "Snct",
-                     "Sch", "Sch2", "Sx", "SSamplerCh2"}, 8),
-    "VA MSK/Nucs": ({"Vb"}, 1),
-    "Mucic": ({"Mucic"}, 1),
-    "Zir": ({"Zir"}, 1),
+    "Moffitt AI": (frozenset({"Mai", "Zai"}), 3),
+    "Moffitt US": (frozenset({"Mus"}), 2),
+    "Moffitt Cardiothoracic": (frozenset({"Mch", "Mch2", "Mc"}), 2),
+    "Peds": (frozenset({"Peds"}), 1),
+    "Moffitt Neuro": (frozenset({"Mucic", "Mnct"}), 3),
+    "Moffitt Bone": (frozenset({"Mb"}), 1),
+    "Moffitt Nucs": (frozenset({"Mnuc"}), 2),
+    "PCMB Breast": (frozenset({"Pcbi"}), 1),
+    "ZSFG Total": (frozenset({"Ser", "Smr", "Sbi", "Sir", "Sus", "Sai", "Snct",
+                              "Sch", "Sch2", "Sx", "SSamplerCh2"}), 8),
+    "VA MSK/Nucs": (frozenset({"Vb"}), 1),
+    "Mucic": (frozenset({"Mucic"}), 1),
+    "Zir": (frozenset({"Zir"}), 1),
 }
 
 # Per-rotation maximum constraints (exclusivity rules).
-ROTATION_MAXIMUMS: dict[str, tuple[set[str], int]] = {
-    "Sx": ({"Sx"}, 1),
-    "Snf": ({"Snf"}, 1),
-    "Mnf": ({"Mnf"}, 1),
-    "Snf2": ({"Snf2"}, 1),
-    "PCMB Breast": ({"Pcbi"}, 3),
-    "NucMed Total": ({"Mnuc"}, 5),
-    "VA MSK": ({"Vb"}, 1),
-    "VA IR": ({"Vir"}, 1),
-    "Zir": ({"Zir"}, 1),
-    "Ser": ({"Ser"}, 2),
-    "Mai": ({"Mai"}, 5),
-    "Mucic": ({"Mucic"}, 6),
+ROTATION_MAXIMUMS: dict[str, tuple[frozenset[str], int]] = {
+    "Sx": (frozenset({"Sx"}), 1),
+    "Snf": (frozenset({"Snf"}), 1),
+    "Mnf": (frozenset({"Mnf"}), 1),
+    "Snf2": (frozenset({"Snf2"}), 1),
+    "PCMB Breast": (frozenset({"Pcbi"}), 3),
+    "NucMed Total": (frozenset({"Mnuc"}), 5),
+    "VA MSK": (frozenset({"Vb"}), 1),
+    "VA IR": (frozenset({"Vir"}), 1),
+    "Zir": (frozenset({"Zir"}), 1),
+    "Ser": (frozenset({"Ser"}), 2),
+    "Mai": (frozenset({"Mai"}), 5),
+    "Mucic": (frozenset({"Mucic"}), 6),
 }
 
 
-def check_staffing(
+# Site label → hospital system for the per-site staffing summary.
+SITE_GROUPS: dict[str, HospitalSystem] = {
+    "UCSF (Moffitt/Parnassus)": HospitalSystem.UCSF,
+    "ZSFG": HospitalSystem.ZSFG,
+    "VA": HospitalSystem.VA,
+}
+
+
+def _label_counts(
+    code_counts: Counter[str],
+    code_sets: list[set[str]],
+    hits: dict[str, list[int]],
+) -> list[int]:
+    """Count residents per code set from one week's code histogram.
+
+    A code counts toward a set if it, or its FSE base code, is a member.
+    ``hits`` memoizes code → matching set indices across calls, so each
+    distinct code is resolved once and each week costs one pass over its
+    distinct codes rather than one pass over residents per set.
+    """
+    counts = [0] * len(code_sets)
+    for code, n in code_counts.items():
+        idx = hits.get(code)
+        if idx is None:
+            base = fse_to_base_code(code)
+            idx = hits[code] = [
+                i for i, codes in enumerate(code_sets)
+                if code in codes or base in codes
+            ]
+        for i in idx:
+            counts[i] += n
+    return counts
+
+
+def check_staffing_and_summary(
     grid: ScheduleGrid,
     num_weeks: int = 52,
     constraints: list[StaffingConstraint] | None = None,
-) -> list[StaffingViolation]:
-    """Check staffing levels using per-rotation minimums and maximums.
+    week_assignments: dict[int, dict[str, str]] | None = None,
+) -> tuple[list[StaffingViolation], dict[str, dict]]:
+    """Run check_staffing and staffing_summary in a single pass over the weeks.
 
-    If dynamic constraints are provided, uses those for minimum checks.
-    Always uses ROTATION_MAXIMUMS for maximum checks.
-    Falls back to ROTATION_MINIMUMS when no dynamic constraints given.
+    Each week's assignments are reduced to one code histogram that feeds
+    both the per-label min/max checks and the per-site counts.
+
+    Returns (violations, summary) — see check_staffing / staffing_summary.
     """
     violations = []
+    if week_assignments is None:
+        week_assignments = grid.get_all_week_assignments()
 
     # Build minimums source
     if constraints:
         min_entries = [(sc.label, sc.rotation_codes, sc.min_count) for sc in constraints]
     else:
         min_entries = [(label, codes, min_req) for label, (codes, min_req) in ROTATION_MINIMUMS.items()]
+    max_entries = [(label, codes, max_allowed) for label, (codes, max_allowed) in ROTATION_MAXIMUMS.items()]
+
+    # One count per (minimum, maximum) entry per week, minimums first
+    code_sets = [codes for _, codes, _ in min_entries + max_entries]
+    hits: dict[str, list[int]] = {}
+    # site_label → [total, min, max, min_week], updated as weeks stream by
+    site_stats: dict[str, list[int]] = {}
 
     for week in range(1, num_weeks + 1):
-        week_assignments = grid.get_week_assignments(week)
+        code_counts = Counter(week_assignments.get(week, {}).values())
         block = grid.week_to_block(week)
+        counts = _label_counts(code_counts, code_sets, hits)
 
-        for label, codes, min_req in min_entries:
-            count = sum(1 for code in week_assignments.values()
-                        if code in codes or fse_to_base_code(code) in codes)
+        for (label, _codes, min_req), count in zip(min_entries, counts):
             if count < min_req:
                 violations.append(StaffingViolation(
                     week=week, block=block, label=label,
@@ -90,9 +135,7 @@ def check_staffing(
                     is_under=True,
                 ))
 
-        for label, (codes, max_allowed) in ROTATION_MAXIMUMS.items():
-            count = sum(1 for code in week_assignments.values()
-                        if code in codes or fse_to_base_code(code) in codes)
+        for (label, _codes, max_allowed), count in zip(max_entries, counts[len(min_entries):]):
             if count > max_allowed:
                 violations.append(StaffingViolation(
                     week=week, block=block, label=label,
@@ -100,41 +143,65 @@ def check_staffing(
                     is_under=False,
                 ))
 
+        system_counts: Counter[HospitalSystem] = Counter()
+        for code, n in code_counts.items():
+            system_counts[get_hospital_system(code)] += n
+        for site_label, system in SITE_GROUPS.items():
+            count = system_counts[system]
+            stats = site_stats.get(site_label)
+            if stats is None:
+                site_stats[site_label] = [count, count, count, week]
+                continue
+            stats[0] += count
+            if count < stats[1]:
+                stats[1] = count
+                stats[3] = week
+            if count > stats[2]:
+                stats[2] = count
+
+    summary = {
+        site_label: {
+            "avg": total / num_weeks,
+            "min": min_val,
+            "max": max_val,
+            "min_week": min_week,
+        }
+        for site_label, (total, min_val, max_val, min_week) in site_stats.items()
+    }
+
+    return violations, summary
+
+
+def check_staffing(
+    grid: ScheduleGrid,
+    num_weeks: int = 52,
+    constraints: list[StaffingConstraint] | None = None,
+    week_assignments: dict[int, dict[str, str]] | None = None,
+) -> list[StaffingViolation]:
+    """Check staffing levels using per-rotation minimums and maximums.
+
+    If dynamic constraints are provided, uses those for minimum checks.
+    Always uses ROTATION_MAXIMUMS for maximum checks.
+    Falls back to ROTATION_MINIMUMS when no dynamic constraints given.
+    Pass week_assignments (from grid.get_all_week_assignments()) to share
+    one grid scan across several validators.
+    """
+    violations, _summary = check_staffing_and_summary(
+        grid, num_weeks, constraints=constraints, week_assignments=week_assignments,
+    )
     return violations
 
 
 def staffing_summary(
     grid: ScheduleGrid,
     num_weeks: int = 52,
+    week_assignments: dict[int, dict[str, str]] | None = None,
 ) -> dict[str, dict]:
     """Generate per-site staffing summary (avg/min/max across weeks).
 
     Returns {site_label: {"avg": float, "min": int, "max": int, "min_week": int}}.
     """
-    site_groups = {
-        "UCSF (Moffitt/Parnassus)": HospitalSystem.UCSF,
-        "ZSFG": HospitalSystem.ZSFG,
-        "VA": HospitalSystem.VA,
-    }
-
-    result = {}
-    for site_label, system in site_groups.items():
-        weekly_counts = []
-        for week in range(1, num_weeks + 1):
-            assignments = grid.get_week_assignments(week)
-            count = sum(1 for code in assignments.values()
-                        if get_hospital_system(code) == system)
-            weekly_counts.append((week, count))
-
-        counts = [c for _, c in weekly_counts]
-        if counts:
-            min_val = min(counts)
-            min_week = [w for w, c in weekly_counts if c == min_val][0]
-            result[site_label] = {
-                "avg": sum(counts) / len(counts),
-                "min": min_val,
-                "max": max(counts),
-                "min_week": min_week,
-            }
-
-    return result
+    _violations, summary = check_staffing_and_summary(
+        grid, num_weeks, week_assignments=week_assignments,
+    )
+    return summary
@@ -5,247 +5,60 @@ randomized but realistic preferences for all 60 active residents.
 """
 from __future__ import annotations
 
+import os
+import pickle
 import random
+from contextlib import closing
+from dataclasses import astuple, dataclass
+
 import openpyxl
 
-random.seed(42)  # Reproducible
-
-# Read the 2026-2027 roster from the schedule file
-# Layout: A=Current PGY, B=Resident, C=ESNR, D=ESIR, E=T32, F=NRDR
-src = openpyxl.load_workbook(
-    "Schedule Creation (2026-2027).xlsm", data_only=True, read_only=True,
-)
-ws = src["Historical"]
-
-residents = []
-for row in ws.iter_rows(min_row=3, max_row=80, max_col=6, values_only=True):
-    current_pgy = row[0]
-    name = row[1]
-    if not name or not current_pgy:
-        continue
-    try:
-        pgy = int(current_pgy) + 1  # Increment for target year
-    except (ValueError, TypeError):
-        continue
-    r_year = pgy - 1
-    if r_year < 1 or r_year > 4:
-        continue
-    residents.append({
-        "name": str(name).strip(),
-        "r_year": r_year,
-        "pgy": pgy,
-        "esnr": "x" if row[2] else "",
-        "esir": "x" if row[3] else "",
-        "t32": "x" if row[4] else "",
-        "nrdr": "x" if row[5] else "",
-    })
-src.close()
-
-# Parse name into first/last
-for r in residents:
-    parts = r["name"].split(",", 1)
-    r["last_name"] = parts[0].strip()
-    r["first_name"] = parts[1].strip() if len(parts) > 1 else ""
-    r["full_name"] = f"{r['first_name']} {r['last_name']}"
-
-# Separate by year
-r1s = [r for r in residents if r["r_year"] == 1]
-r2s = [r for r in residents if r["r_year"] == 2]
-r3s = [r for r in residents if r["r_year"] == 3]
-r4s = [r for r in residents if r["r_year"] == 4]
-
-print(f"R1: {len(r1s)}, R2: {len(r2s)}, R3: {len(r3s)}, R4: {len(r4s)}")
-
-# Create workbook
-wb = openpyxl.Workbook()
-
-# === R1 Rotations ===
-ws_r1 = wb.active
-ws_r1.title = "R1 Rotations"
-r1_headers = ["Date", "First Name", "Last Name", "PGY", "Nir", "Mir", "Msk", "Mnuc", "Mucic",
-              "Name", "Msamp Ranking", "Tentative Msamp", "Vac", "Acad", "Leave", "Comment"]
-ws_r1.append(r1_headers)
-
-for r in r1s:
-    ranks = random.sample(range(1, 6), 5)
-    row = [
-        "2026-02-15",
-        r["first_name"],
-        r["last_name"],
-        r["pgy"],
-    ]
-    for rank in ranks:
-        row.append(f"#{rank}")
-    row.extend([
-        r["full_name"],
-        "",
-        "",
-        "10/15, 10/16, 10/17, 3/20, 3/21",
-        "11/10, 11/11",
-        "",
-        "",
-    ])
-    ws_r1.append(row)
-
-# === R2 Rotations ===
-ws_r2 = wb.create_sheet("R2 Rotations")
-r2_headers = ["First Name", "Last Name", "Full Name", "Specialty Pathway Interest", "Add'l Weak",
-             "Track Rank", "NO CALL Weekend Request", "NO CALL Week Request",
-             "NO CALL Holiday Request", "Call Holiday Preference", "Vac", "Acad", "Leave", "Comment"]
-ws_r2.append(r2_headers)
-
-num_tracks = len(r2s)
-for r in r2s:
-    track_order = random.sample(range(1, num_tracks + 1), num_tracks)
-    track_rank_str = ", ".join(str(t) for t in track_order)
-
-    pathway = ""
-    if r["esir"]:
-        pathway = "ESIR"
-    elif r["esnr"]:
-        pathway = "ESNR"
-
-    row = [
-        r["first_name"],
-        r["last_name"],
-        r["full_name"],
-        pathway or "None",
-        "",
-        track_rank_str,
-        "",
-        "",
-        random.choice(["Christmas", "Thanksgiving", "New Years", ""]),
-        "",
-        "12/20, 12/21, 12/22, 4/5, 4/6",
-        "9/15",
-        "",
-        "",
-    ]
-    ws_r2.append(row)
-
-# === R3 Rotations ===
-ws_r3 = wb.create_sheet("R3 Rotations")
-section_codes = ["Mnuc", "Mucic", "Mai", "Mus", "Peds", "Mch", "Mb", "Sbi", "Smr", "Ser", "Vnuc", "Pcbi", "Zir"]
-r3_headers = (["First Name", "Last Name", "Full Name", "Specialty Pathway Interest", "Add'l Weak"]
-              + section_codes
-              + ["TOP Sections", "BOTTOM Sections", "Zir block pref", "AIRP block rank", "AIRP group",
-                 "NO CALL Holiday Request", "NO CALL Weekend Request", "Vac", "Acad", "Leave", "Comment"])
-ws_r3.append(r3_headers)
-
-airp_sessions = ["2", "3+4", "4+5", "9", "10"]
-
-for r in r3s:
-    pathway = ""
-    if r["esir"]:
-        pathway = "ESIR"
-    elif r["esnr"]:
-        pathway = "ESNR"
-    elif r["nrdr"]:
-        pathway = "NR/DR"
-    elif r["t32"]:
-        pathway = "T32"
-
-    row = [
-        r["first_name"],
-        r["last_name"],
-        r["full_name"],
-        pathway or "None",
-        "",
-    ]
 
-    section_ranks = random.sample(range(1, 14), 13)
-    for rank in section_ranks:
-        row.append(f"#{rank}")
-
-    top_indices = sorted(range(13), key=lambda i: section_ranks[i])[:3]
-    bottom_indices = sorted(range(13), key=lambda i: -section_ranks[i])[:3]
-    top_str = ", ".join(section_codes[i] for i in top_indices)
-    bottom_str = ", ".join(section_codes[i] for i in bottom_indices)
-
-    zir_blocks = random.sample(range(1, 7), 3)
-    zir_str = ", ".join(str(b) for b in sorted(zir_blocks))
-
-    airp_order = random.sample(airp_sessions, len(airp_sessions))
-    airp_str = ", ".join(airp_order)
-
-    other_r3s = [x for x in r3s if x["name"] != r["name"]]
-    group_mate = random.choice(other_r3s)["full_name"] if random.random() < 0.3 else ""
-
-    row.extend([
-        top_str,
-        bottom_str,
-        zir_str,
-        airp_str,
-        group_mate,
-        random.choice(["Christmas", "Thanksgiving", "New Years", ""]),
-        "",
-        "3/15, 3/16, 3/17, 6/1, 6/2",
-        "10/5",
-        "",
-        "",
-    ])
-    ws_r3.append(row)
-
-# === R4 Rotations ===
-ws_r4 = wb.create_sheet("R4 Rotations")
-r4_section_codes = ["Mai", "Mus", "Mb", "Ser", "Mch", "Mucic", "Peds", "Smr"]
-r4_headers = (["First Name", "Last Name", "Full Name",
+@dataclass(slots=True)
+class Resident:
+    """One roster row, with the name pre-split for the prefs sheets."""
+    name: str
+    r_year: int
+    pgy: int
+    esnr: str
+    esir: str
+    t32: str
+    nrdr: str
+    first_name: str = ""
+    last_name: str = ""
+    full_name: str = ""
+
+
+HOLIDAY_CHOICES = ("Christmas", "Thanksgiving", "New Years", "")
+NO_CALL_HOLIDAY_CHOICES = HOLIDAY_CHOICES[:3]  # No Call sheet always names one
+
+R1_HEADERS = ("Date", "First Name", "Last Name", "PGY", "Nir", "Mir", "Msk", "Mnuc", "Mucic",
+              "Name", "Msamp Ranking", "Tentative Msamp", "Vac", "Acad", "Leave", "Comment")
+
+R2_HEADERS = ("First Name", "Last Name", "Full Name", "Specialty Pathway Interest", "Add'l Weak",
+              "Track Rank", "NO CALL Weekend Request", "NO CALL Week Request",
+              "NO CALL Holiday Request", "Call Holiday Preference", "Vac", "Acad", "Leave", "Comment")
+
+SECTION_CODES = ("Mnuc", "Mucic", "Mai", "Mus", "Peds", "Mch", "Mb", "Sbi", "Smr", "Ser",
+                 "Vnuc", "Pcbi", "Zir")
+R3_HEADERS = (("First Name", "Last Name", "Full Name", "Specialty Pathway Interest", "Add'l Weak")
+              + SECTION_CODES
+              + ("TOP Sections", "BOTTOM Sections", "Zir block pref", "AIRP block rank", "AIRP group",
+                 "NO CALL Holiday Request", "NO CALL Weekend Request", "Vac", "Acad", "Leave",
+                 "Comment"))
+AIRP_SESSIONS = ("2", "3+4", "4+5", "9", "10")
+
+R4_SECTION_CODES = ("Mai", "Mus", "Mb", "Ser", "Mch", "Mucic", "Peds", "Smr")
+R4_HEADERS = (("First Name", "Last Name", "Full Name",
                "T32", "ESIR", "NRDR", "ESNR",
                "Section Pref", "FSE", "FSE/Rotation Pref", "Distribution Pref",
-               "Research Months", "CEP Months"]
-              + [str(b) for b in range(1, 14)]
-              + r4_section_codes
-              + ["NO CALL Holiday Request", "Vac", "Acad", "Leave", "Comment"])
-ws_r4.append(r4_headers)
-
-fse_options = ["Abdominal Imaging", "Breast", "Neuroradiology", "Chest", "MSK", ""]
-
-for r in r4s:
-    if r["t32"]:
-        research = 0
-        cep = 0
-    else:
-        research = random.choice([0, 0, 0, 1, 1, 2])
-        cep = random.choice([0, 0, 0, 1])
-
-    fse = random.choice(fse_options)
-    if r["nrdr"] or r["esir"]:
-        fse = ""
-
-    row = [
-        r["first_name"],
-        r["last_name"],
-        r["full_name"],
-        r["t32"],
-        r["esir"],
-        r["nrdr"],
-        r["esnr"],
-        "",
-        fse,
-        "Contiguous" if fse else "",
-        "Sequential" if fse else "",
-        research,
-        cep,
-    ]
-
-    for b in range(1, 14):
-        row.append("")
-
-    for code in r4_section_codes:
-        row.append(random.randint(1, 5))
+               "Research Months", "CEP Months")
+              + tuple(str(b) for b in range(1, 14))
+              + R4_SECTION_CODES
+              + ("NO CALL Holiday Request", "Vac", "Acad", "Leave", "Comment"))
+FSE_OPTIONS = ("Abdominal Imaging", "Breast", "Neuroradiology", "Chest", "MSK", "")
 
-    row.extend([
-        random.choice(["Christmas", "Thanksgiving", "New Years", ""]),
-        "11/25, 11/26, 5/10, 5/11",
-        "2/15",
-        "",
-        "",
-    ])
-    ws_r4.append(row)
-
-# === No Call Pref ===
-ws_nc = wb.create_sheet("No Call Pref")
-nc_headers = ["First Name", "Last Name", "Current PGY", "Name", "R#",
+NC_HEADERS = ("First Name", "Last Name", "Current PGY", "Name", "R#",
               "Prior Holiday Call 2023-2024", "Prior Holiday Call 2024-2025",
               "Prior Holiday Call 2025-2026",
               "NO CALL Holiday Request", "Call Holiday Preference",
@@ -253,53 +66,344 @@ nc_headers = ["First Name", "Last Name", "Current PGY", "Name", "R#",
               "Vac", "Acad", "Leave",
               "Prior Holiday Call ALL (Formatted)", "NO CALL Holiday Request (Formatted)",
               "NO CALL Weekend Request (Formatted)", "Vac/Acad/Leave (Formatted)",
-              "NO NF ASSIGNMENTS", "Stack ok?", "Gad Preference", "Comment"]
-ws_nc.append(nc_headers)
-
-for r in residents:
-    no_call_dates = []
-    for _ in range(random.randint(2, 6)):
-        month = random.randint(7, 12) if random.random() < 0.5 else random.randint(1, 6)
-        day = random.randint(1, 28)
-        no_call_dates.append(f"{month}/{day}")
-
-    nf_dates_str = f"{r['full_name']}:{', '.join(no_call_dates)}"
-
-    row = [
-        r["first_name"],
-        r["last_name"],
-        r["pgy"],
-        r["full_name"],
-        f"R{r['r_year']}",
-        "", "", "",
-        random.choice(["Christmas", "Thanksgiving", "New Years"]),
-        "",
-        "",
-        "",
-        "10/15, 3/20",
-        "11/10",
-        "",
-        "", "", "", "",
-        nf_dates_str,
-        random.choice(["Yes", "No"]),
-        random.choice(["None", "Some", "A lot"]),
-        "",
+              "NO NF ASSIGNMENTS", "Stack ok?", "Gad Preference", "Comment")
+
+CG_HEADERS = ("First Name", "Last Name", "Current PGY", "Name", "R#")
+
+
+def load_roster(
+    path: str = "Schedule Creation (2026-2027).xlsm",
+    cache_path: str = "tests/.roster_cache.pkl",
+) -> list[Resident]:
+    """Read the 2026-2027 roster, reusing a pickle cache of the same xlsm.
+
+    The cache stores plain tuples keyed on the xlsm's absolute path and
+    mtime, so it loads no matter how this module was imported. If the
+    xlsm is missing, a cache for the same path is still used.
+    """
+    source = os.path.abspath(path)
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    try:
+        with open(cache_path, "rb") as f:
+            cached_source, cached_mtime, rows = pickle.load(f)
+        if cached_source == source and mtime in (None, cached_mtime):
+            return [Resident(*row) for row in rows]
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        pass  # missing, stale or unreadable cache: fall through and re-read the xlsm
+
+    residents = _read_roster(path)
+    rows = [astuple(r) for r in residents]
+    with open(cache_path, "wb") as f:
+        pickle.dump((source, os.path.getmtime(path), rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return residents
+
+
+def _read_roster(path: str) -> list[Resident]:
+    """Parse the Historical sheet.
+
+    Layout: A=Current PGY, B=Resident, C=ESNR, D=ESIR, E=T32, F=NRDR
+    """
+    with closing(openpyxl.load_workbook(
+        path, data_only=True, read_only=True, keep_vba=False, keep_links=False,
+    )) as src:
+        ws = src["Historical"]
+        ws.reset_dimensions()  # don't trust the sheet's stored used range
+
+        residents: list[Resident] = []
+        for row in ws.iter_rows(min_row=3, max_row=80, max_col=6, values_only=True):
+            current_pgy = row[0]
+            name = row[1]
+            if not name or not current_pgy:
+                continue
+            try:
+                pgy = int(current_pgy) + 1  # Increment for target year
+            except (ValueError, TypeError):
+                continue
+            r_year = pgy - 1
+            if r_year < 1 or r_year > 4:
+                continue
+            name = str(name).strip()
+            last, _, first = name.partition(",")
+            first_name, last_name = first.strip(), last.strip()
+            residents.append(Resident(
+                name=name,
+                r_year=r_year,
+                pgy=pgy,
+                esnr="x" if row[2] else "",
+                esir="x" if row[3] else "",
+                t32="x" if row[4] else "",
+                nrdr="x" if row[5] else "",
+                first_name=first_name,
+                last_name=last_name,
+                full_name=f"{first_name} {last_name}",
+            ))
+    return residents
+
+
+def build_r1_rows(r1s: list[Resident]) -> list[list]:
+    _sample = random.sample
+
+    r1_rows: list = [R1_HEADERS]
+
+    # Full-width row with the constant columns filled; each resident gets a copy
+    r1_template = [""] * len(R1_HEADERS)
+    r1_template[0] = "2026-02-15"
+    r1_template[R1_HEADERS.index("Vac")] = "10/15, 10/16, 10/17, 3/20, 3/21"
+    r1_template[R1_HEADERS.index("Acad")] = "11/10, 11/11"
+    rank_col = R1_HEADERS.index("Nir")
+    name_col = R1_HEADERS.index("Name")
+
+    for r in r1s:
+        ranks = _sample(range(1, 6), 5)
+        row = r1_template.copy()
+        row[1] = r.first_name
+        row[2] = r.last_name
+        row[3] = r.pgy
+        row[rank_col:rank_col + 5] = [f"#{rank}" for rank in ranks]
+        row[name_col] = r.full_name
+        r1_rows.append(row)
+    return r1_rows
+
+
+def build_r2_rows(r2s: list[Resident]) -> list[list]:
+    _choice = random.choice
+    _sample = random.sample
+
+    r2_rows: list = [R2_HEADERS]
+
+    num_tracks = len(r2s)
+    for r in r2s:
+        track_order = _sample(range(1, num_tracks + 1), num_tracks)
+        track_rank_str = ", ".join(map(str, track_order))
+
+        pathway = ""
+        if r.esir:
+            pathway = "ESIR"
+        elif r.esnr:
+            pathway = "ESNR"
+
+        row = [
+            r.first_name,
+            r.last_name,
+            r.full_name,
+            pathway or "None",
+            "",
+            track_rank_str,
+            "",
+            "",
+            _choice(HOLIDAY_CHOICES),
+            "",
+            "12/20, 12/21, 12/22, 4/5, 4/6",
+            "9/15",
+            "",
+            "",
+        ]
+        r2_rows.append(row)
+    return r2_rows
+
+
+def build_r3_rows(r3s: list[Resident]) -> list[list]:
+    _choice = random.choice
+    _sample = random.sample
+    _rand = random.random
+    _randrange = random.randrange
+
+    r3_rows: list = [R3_HEADERS]
+    r3_template = [""] * len(R3_HEADERS)
+    r3_template[R3_HEADERS.index("Vac")] = "3/15, 3/16, 3/17, 6/1, 6/2"
+    r3_template[R3_HEADERS.index("Acad")] = "10/5"
+    section_col = R3_HEADERS.index(SECTION_CODES[0])
+    top_col = R3_HEADERS.index("TOP Sections")
+
+    for i, r in enumerate(r3s):
+        pathway = ""
+        if r.esir:
+            pathway = "ESIR"
+        elif r.esnr:
+            pathway = "ESNR"
+        elif r.nrdr:
+            pathway = "NR/DR"
+        elif r.t32:
+            pathway = "T32"
+
+        row = r3_template.copy()
+        row[0] = r.first_name
+        row[1] = r.last_name
+        row[2] = r.full_name
+        row[3] = pathway or "None"
+
+        section_ranks = _sample(range(1, 14), 13)
+        row[section_col:section_col + len(SECTION_CODES)] = [f"#{rank}" for rank in section_ranks]
+
+        # section_ranks is a permutation of 1..13, so invert it instead of sorting
+        pos = [0] * 14
+        for k, rank in enumerate(section_ranks):
+            pos[rank] = k
+        top_str = ", ".join(SECTION_CODES[pos[rank]] for rank in (1, 2, 3))
+        bottom_str = ", ".join(SECTION_CODES[pos[rank]] for rank in (13, 12, 11))
+
+        zir_blocks = _sample(range(1, 7), 3)
+        zir_blocks.sort()
+        zir_str = ", ".join(map(str, zir_blocks))
+
+        airp_order = _sample(AIRP_SESSIONS, len(AIRP_SESSIONS))
+        airp_str = ", ".join(airp_order)
+
+        group_mate = ""
+        if _rand() < 0.3:
+            # Any other R3: draw from n-1 slots and skip over this resident
+            j = _randrange(len(r3s) - 1)
+            if j >= i:
+                j += 1
+            group_mate = r3s[j].full_name
+
+        row[top_col:top_col + 6] = [top_str, bottom_str, zir_str, airp_str, group_mate,
+                                    _choice(HOLIDAY_CHOICES)]
+        r3_rows.append(row)
+    return r3_rows
+
+
+def build_r4_rows(r4s: list[Resident]) -> list[list]:
+    _choice = random.choice
+    _randint = random.randint
+
+    r4_rows: list = [R4_HEADERS]
+    r4_template = [""] * len(R4_HEADERS)
+    r4_template[R4_HEADERS.index("Vac")] = "11/25, 11/26, 5/10, 5/11"
+    r4_template[R4_HEADERS.index("Acad")] = "2/15"
+    fse_col = R4_HEADERS.index("FSE")
+    org_col = R4_HEADERS.index("FSE/Rotation Pref")
+    dist_col = R4_HEADERS.index("Distribution Pref")
+    research_col = R4_HEADERS.index("Research Months")
+    cep_col = R4_HEADERS.index("CEP Months")
+    section_col = R4_HEADERS.index(R4_SECTION_CODES[0])
+    holiday_col = R4_HEADERS.index("NO CALL Holiday Request")
+
+    for r in r4s:
+        if r.t32:
+            research = 0
+            cep = 0
+        else:
+            research = _choice((0, 0, 0, 1, 1, 2))
+            cep = _choice((0, 0, 0, 1))
+
+        fse = _choice(FSE_OPTIONS)
+        if r.nrdr or r.esir:
+            fse = ""
+
+        row = r4_template.copy()
+        row[0] = r.first_name
+        row[1] = r.last_name
+        row[2] = r.full_name
+        row[3] = r.t32
+        row[4] = r.esir
+        row[5] = r.nrdr
+        row[6] = r.esnr
+        row[fse_col] = fse
+        if fse:
+            row[org_col] = "Contiguous"
+            row[dist_col] = "Sequential"
+        row[research_col] = research
+        row[cep_col] = cep
+        # block columns "1".."13" stay blank
+        row[section_col:section_col + len(R4_SECTION_CODES)] = [
+            _randint(1, 5) for _code in R4_SECTION_CODES
+        ]
+        row[holiday_col] = _choice(HOLIDAY_CHOICES)
+        r4_rows.append(row)
+    return r4_rows
+
+
+def build_no_call_rows(residents: list[Resident]) -> list[list]:
+    _choice = random.choice
+    _randint = random.randint
+    _rand = random.random
+
+    nc_rows: list = [NC_HEADERS]
+
+    for r in residents:
+        no_call_dates = []
+        for _ in range(_randint(2, 6)):
+            month = _randint(7, 12) if _rand() < 0.5 else _randint(1, 6)
+            day = _randint(1, 28)
+            no_call_dates.append(f"{month}/{day}")
+
+        nf_dates_str = f"{r.full_name}:{', '.join(no_call_dates)}"
+
+        row = [
+            r.first_name,
+            r.last_name,
+            r.pgy,
+            r.full_name,
+            f"R{r.r_year}",
+            "", "", "",
+            _choice(NO_CALL_HOLIDAY_CHOICES),
+            "",
+            "",
+            "",
+            "10/15, 3/20",
+            "11/10",
+            "",
+            "", "", "", "",
+            nf_dates_str,
+            _choice(("Yes", "No")),
+            _choice(("None", "Some", "A lot")),
+            "",
+        ]
+        nc_rows.append(row)
+    return nc_rows
+
+
+def build_callgad_rows(residents: list[Resident]) -> list[list]:
+    cg_rows: list = [CG_HEADERS]
+    for r in residents:
+        cg_rows.append([r.first_name, r.last_name, r.pgy, r.full_name, f"R{r.r_year}"])
+    return cg_rows
+
+
+def write_workbook(output_path: str, sheets: list[tuple[str, list[list]]]) -> None:
+    """Save (title, rows) sheets in write-only mode: rows stream straight to XML."""
+    wb = openpyxl.Workbook(write_only=True)
+    for title, rows in sheets:
+        ws = wb.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+    wb.save(output_path)
+
+
+def main() -> None:
+    random.seed(42)  # Reproducible
+
+    residents = load_roster()
+
+    # Separate by year
+    by_year: dict[int, list[Resident]] = {1: [], 2: [], 3: [], 4: []}
+    for r in residents:
+        by_year[r.r_year].append(r)
+    r1s, r2s, r3s, r4s = by_year[1], by_year[2], by_year[3], by_year[4]
+
+    # Sheets are built in this order so the seeded draws stay reproducible
+    sheets = [
+        ("R1 Rotations", build_r1_rows(r1s)),
+        ("R2 Rotations", build_r2_rows(r2s)),
+        ("R3 Rotations", build_r3_rows(r3s)),
+        ("R4 Rotations", build_r4_rows(r4s)),
+        ("No Call Pref", build_no_call_rows(residents)),
+        ("CallGad Responses", build_callgad_rows(residents)),
     ]
-    ws_nc.append(row)
-
-# === CallGad Responses (minimal) ===
-ws_cg = wb.create_sheet("CallGad Responses")
-cg_headers = ["First Name", "Last Name", "Current PGY", "Name", "R#"]
-ws_cg.append(cg_headers)
-for r in residents:
-    ws_cg.append([r["first_name"], r["last_name"], r["pgy"], r["full_name"], f"R{r['r_year']}"])
-
-# Save
-output_path = "tests/dummy_prefs_2026_2027.xlsx"
-wb.save(output_path)
-print(f"Wrote dummy preferences to {output_path}")
-print(f"  R1 Rotations: {len(r1s)} rows")
-print(f"  R2 Rotations: {len(r2s)} rows")
-print(f"  R3 Rotations: {len(r3s)} rows")
-print(f"  R4 Rotations: {len(r4s)} rows")
-print(f"  No Call Pref: {len(residents)} rows")
+
+    output_path = "tests/dummy_prefs_2026_2027.xlsx"
+    write_workbook(output_path, sheets)
+    print(
+        f"R1: {len(r1s)}, R2: {len(r2s)}, R3: {len(r3s)}, R4: {len(r4s)}\n"
+        f"Wrote dummy preferences to {output_path}\n"
+        f"  R1 Rotations: {len(r1s)} rows\n"
+        f"  R2 Rotations: {len(r2s)} rows\n"
+        f"  R3 Rotations: {len(r3s)} rows\n"
+        f"  R4 Rotations: {len(r4s)} rows\n"
+        f"  No Call Pref: {len(residents)} rows"
+    )
+
+
+if __name__ == "__main__":
+    main()
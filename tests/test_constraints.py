@@ -19,7 +19,16 @@ from schedule_maker.models.rotation import (
     get_hospital_system,
     fse_to_base_code,
 )
-from schedule_maker.validation.staffing import ROTATION_MINIMUMS, ROTATION_MAXIMUMS
+from schedule_maker.models.resident import Resident
+from schedule_maker.models.schedule import ScheduleGrid
+from schedule_maker.validation.hospital_conflict import check_hospital_conflicts
+from schedule_maker.validation.staffing import (
+    ROTATION_MINIMUMS,
+    ROTATION_MAXIMUMS,
+    check_staffing,
+    check_staffing_and_summary,
+    staffing_summary,
+)
 from schedule_maker.staffing_utils import _ROTATION_YEAR_ELIGIBILITY, build_fill_candidates
 
 
@@ -333,3 +342,75 @@ class TestNFRulesDefaults:
     def test_preferred_pull_rotations(self):
         rules = NFRules()
         assert rules.preferred_pull_rotations == {"Pcmb", "Mb", "Mucic", "Peds", "Mnuc", "Pcbi"}
+
+
+# ── 9. Schedule Grid ────────────────────────────────────────────
+
+
+class TestWeekAssignments:
+    def test_all_weeks_match_per_week_lookup(self):
+        """Single-pass week table equals per-week lookups, NF overlay included."""
+        grid = ScheduleGrid()
+        grid.assign_block("A", 1, "Mai")
+        grid.assign_block("B", 1, "Sbi")
+        grid.assign_block("B", 2, "Vb")
+        grid.assign_nf("A", 2, "Mnf")
+        grid.assign_nf("C", 5, "Snf2")
+        table = grid.get_all_week_assignments()
+        for w in range(1, 9):
+            assert table.get(w, {}) == grid.get_week_assignments(w)
+        assert table[2]["A"] == "Mnf"
+
+    def test_week_index_tracks_overwrites_and_restore(self):
+        grid = ScheduleGrid()
+        grid.assign_block("A", 1, "Mai")
+        snapshot = dict(grid.assignments)
+        grid.assign("A", 2, "Sbi")
+        assert grid.get_week_assignments(2) == {"A": "Sbi"}
+        grid.replace_assignments(snapshot)
+        assert grid.get_week_assignments(2) == {"A": "Mai"}
+        assert ScheduleGrid(assignments=snapshot).get_week_assignments(3) == {"A": "Mai"}
+
+
+# ── 10. Staffing Validation ─────────────────────────────────────
+
+
+class TestCheckStaffing:
+    def test_fse_counts_toward_base_group(self):
+        """FSE-Bre fills the Pcbi minimum; two Vb breach the VA MSK cap."""
+        grid = ScheduleGrid()
+        grid.assign("A", 1, "FSE-Bre")
+        grid.assign("B", 1, "Vb")
+        grid.assign("C", 1, "Vb")
+        violations = check_staffing(grid, num_weeks=1)
+        under = {v.label for v in violations if v.is_under}
+        over = {(v.label, v.count) for v in violations if not v.is_under}
+        assert "PCMB Breast" not in under
+        assert "Moffitt AI" in under
+        assert over == {("VA MSK", 2)}
+
+    def test_fused_pass_matches_wrappers(self):
+        grid = ScheduleGrid()
+        for i, code in enumerate(["Mai", "Sbi", "Vb", "Ser", "Peds"]):
+            grid.assign_block(f"R{i}", 1, code)
+        grid.assign_nf("R0", 2, "Mnf")
+        violations, summary = check_staffing_and_summary(grid, num_weeks=4)
+        assert violations == check_staffing(grid, num_weeks=4)
+        assert summary == staffing_summary(grid, num_weeks=4)
+        assert summary["ZSFG"]["max"] == 2
+        assert summary["UCSF (Moffitt/Parnassus)"] == {
+            "avg": 2.0, "min": 2, "max": 2, "min_week": 1,
+        }
+
+
+# ── 11. Hospital Conflict Validation ────────────────────────────
+
+
+class TestCheckHospitalConflicts:
+    def test_split_biweek_flags_conflict(self):
+        res = Resident(name="A", r_year=3)
+        res.schedule = {1: "Mai", 2: "Sbi", 3: "Mai", 4: "Mai", 5: "Vb", 6: "Res"}
+        conflicts = check_hospital_conflicts([res], num_blocks=2)
+        assert len(conflicts) == 1
+        assert conflicts[0].block == 1
+        assert sorted(conflicts[0].rotations) == ["Mai", "Sbi"]
@@ -0,0 +1,109 @@
+"""Unit tests for the CP-SAT solver wrappers on small synthetic cohorts.
+
+No Excel files needed — residents and base schedules are built inline.
+"""
+
+from __future__ import annotations
+
+from schedule_maker.models.constraints import NFRules
+from schedule_maker.models.resident import Resident, TrackPrefs
+from schedule_maker.solver.nf_solver import _greedy_hint, solve_night_float
+from schedule_maker.solver.track_matcher import solve_track_assignment
+
+
+def _residents(r_year: int, count: int) -> list[Resident]:
+    return [Resident(name=f"R{r_year}_{i}, Test", r_year=r_year) for i in range(count)]
+
+
+def _nf_weeks(result, name: str) -> list[int]:
+    return sorted(w for w, _code in result.assignments.get(name, []))
+
+
+class TestNightFloatSpacing:
+    def test_min_spacing_respected(self):
+        """No resident gets two NF weeks closer than min_spacing_weeks."""
+        residents = _residents(2, 4) + _residents(3, 4) + _residents(4, 4)
+        rules = NFRules()
+        result = solve_night_float(residents, {}, rules, num_weeks=24)
+        assert result.feasible
+        for res in residents:
+            weeks = _nf_weeks(result, res.name)
+            for a, b in zip(weeks, weeks[1:]):
+                assert b - a >= rules.min_spacing_weeks
+
+    def test_spacing_makes_tight_year_infeasible(self):
+        """R4 needs 2 Snf2 weeks at least 4 apart — impossible in 4 weeks."""
+        result = solve_night_float(_residents(4, 1), {}, NFRules(), num_weeks=4)
+        assert not result.feasible
+
+
+class TestNightFloatVariables:
+    def test_eligibility_respected(self):
+        """R2 only gets Mnf and R4 only gets Snf2."""
+        r2s, r4s = _residents(2, 2), _residents(4, 2)
+        result = solve_night_float(r2s + _residents(3, 2) + r4s, {}, NFRules(), num_weeks=24)
+        assert result.feasible
+        for res in r2s:
+            assert {c for _w, c in result.assignments[res.name]} == {"Mnf"}
+        for res in r4s:
+            assert {c for _w, c in result.assignments[res.name]} == {"Snf2"}
+
+    def test_lock_on_impossible_slot_is_infeasible(self):
+        """Locking an R2 into Snf2 cannot be satisfied."""
+        r2 = _residents(2, 1)
+        result = solve_night_float(
+            r2, {}, NFRules(), num_weeks=24,
+            locked_assignments={r2[0].name: [(1, "Snf2")]},
+        )
+        assert not result.feasible
+
+
+class TestNightFloatHint:
+    def test_greedy_hint_meets_minimums(self):
+        """The warm-start hint places required weeks with valid spacing."""
+        residents = _residents(2, 2) + _residents(3, 2) + _residents(4, 2)
+        rules = NFRules()
+        var_maps = {
+            "Mnf": {(r.name, w): None for r in residents if r.r_year != 4 for w in range(1, 25)},
+            "Snf2": {(r.name, w): None for r in residents if r.r_year != 2 for w in range(1, 25)},
+        }
+        placed = _greedy_hint(residents, {}, rules, 24, var_maps, {})
+        weeks: dict[str, list[int]] = {}
+        for name, w, _shift in placed:
+            weeks.setdefault(name, []).append(w)
+        for res in residents:
+            need = {2: rules.r2_mnf_weeks, 3: 1, 4: rules.r4_snf2_weeks}[res.r_year]
+            ws = sorted(weeks.get(res.name, []))
+            assert len(ws) == need
+            assert all(b - a >= rules.min_spacing_weeks for a, b in zip(ws, ws[1:]))
+
+
+class TestTrackAssignment:
+    def test_one_to_one_gets_top_choices(self):
+        """Distinct first choices are all honoured with zero penalty."""
+        residents = _residents(2, 3)
+        for i, res in enumerate(residents):
+            res.track_prefs = TrackPrefs(rankings={i + 1: 1, (i + 1) % 3 + 1: 2})
+        result = solve_track_assignment(residents, num_tracks=3)
+        assert result.feasible
+        assert result.total_rank_penalty == 0
+        assert sorted(result.assignments.values()) == [1, 2, 3]
+
+    def test_overflow_fills_every_track(self):
+        """With more residents than tracks, every track is used."""
+        residents = _residents(2, 5)
+        for res in residents:
+            res.track_prefs = TrackPrefs(rankings={1: 1, 2: 2, 3: 3})
+        result = solve_track_assignment(residents, num_tracks=3)
+        assert result.feasible
+        assert set(result.assignments.values()) == {1, 2, 3}
+
+    def test_identical_prefs_assigned_in_input_order(self):
+        """Interchangeable residents get non-decreasing track numbers."""
+        residents = _residents(2, 4)
+        for res in residents:
+            res.track_prefs = TrackPrefs(rankings={1: 1, 2: 2, 3: 3, 4: 4})
+        result = solve_track_assignment(residents, num_tracks=4)
+        assert result.feasible
+        assert result.total_rank_penalty == 0 + 1 + 2 + 3
+        assert [result.assignments[r.name] for r in residents] == [1, 2, 3, 4]